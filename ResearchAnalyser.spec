@@ -1,9 +1,9 @@
 # -*- mode: python ; coding: utf-8 -*-
 from PyInstaller.utils.hooks import collect_all
 
-datas = [('app.py', '.'), ('config.yaml', '.'), ('monkeyocr.py', '.'), ('research_analyser', 'research_analyser'), ('.streamlit', '.streamlit'), ('packaging/python312.tar.gz', '.'), ('packaging/beautiful_mermaid/render.bundle.mjs', 'packaging/beautiful_mermaid')]
+datas = [('app.py', '.'), ('config.yaml', '.'), ('monkeyocr.py', '.'), ('research_analyser', 'research_analyser'), ('.streamlit', '.streamlit'), ('packaging/python312.tar.zst', '.'), ('packaging/beautiful_mermaid/render.bundle.mjs', 'packaging/beautiful_mermaid')]
 binaries = []
-hiddenimports = ['webview', 'webview.platforms.cocoa']
+hiddenimports = ['webview', 'webview.platforms.cocoa', 'zstandard']
 tmp_ret = collect_all('webview')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
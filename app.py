@@ -1,12 +1,15 @@
 """Streamlit Web UI for Research Analyser."""
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import shutil
 import subprocess
 import sys
 import urllib.request
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 
 # Load .env before anything else so GOOGLE_API_KEY etc. are available.
@@ -30,20 +33,73 @@ except ImportError:
 
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # optional speed-up — fall back to the stdlib json module
+    orjson = None
+
 from research_analyser.config import Config
 from research_analyser.models import AnalysisOptions
 
 logging.basicConfig(level=logging.INFO)
 
 
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson (no intermediate str decode) when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _json_dumps_pretty(obj, default=None) -> str:
+    """Serialise obj as 2-space-indented, non-ASCII-preserving JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=default)
+
+
+def _orjson_default(obj):
+    """Fallback encoder for types orjson does not serialise natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Type {type(obj).__name__} not serializable")
+
+
+def _report_json_text(report) -> str:
+    """Serialise an AnalysisReport to indented JSON text.
+
+    orjson walks the dataclass tree directly (dataclasses, datetimes and str
+    enums are native to it), skipping the asdict() + json round trip that
+    report.to_json() performs before the result is dumped again.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            default=_orjson_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return _json_dumps_pretty(report.to_json())
+
+
 def _truthy(value: str) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _set_env(key: str, val: str) -> None:
+    """Set an env var only when it changes — each write is a putenv(3) call,
+    and this script re-executes on every widget interaction."""
+    if os.environ.get(key) != val:
+        os.environ[key] = val
+
+
 def _bootstrap_runtime_env() -> None:
     if _truthy(os.environ.get("SKIP_SSL_VERIFICATION", "")):
-        os.environ["SKIP_SSL_VERIFICATION"] = "true"
-        os.environ["PYTHONHTTPSVERIFY"] = "0"
+        _set_env("SKIP_SSL_VERIFICATION", "true")
+        _set_env("PYTHONHTTPSVERIFY", "0")
 
     try:
         boot_config = Config.load()
@@ -54,8 +110,8 @@ def _bootstrap_runtime_env() -> None:
         os.environ["GOOGLE_API_KEY"] = boot_config.google_api_key
 
     if boot_config.diagrams.skip_ssl_verification:
-        os.environ["SKIP_SSL_VERIFICATION"] = "true"
-        os.environ["PYTHONHTTPSVERIFY"] = "0"
+        _set_env("SKIP_SSL_VERIFICATION", "true")
+        _set_env("PYTHONHTTPSVERIFY", "0")
 
 
 _bootstrap_runtime_env()
@@ -547,8 +603,8 @@ def _should_skip_ssl() -> bool:
 
 def _apply_skip_ssl_env() -> None:
     if _should_skip_ssl():
-        os.environ["SKIP_SSL_VERIFICATION"] = "true"
-        os.environ["PYTHONHTTPSVERIFY"] = "0"
+        _set_env("SKIP_SSL_VERIFICATION", "true")
+        _set_env("PYTHONHTTPSVERIFY", "0")
 
 
 def _collect_pb_intermediate_images(
@@ -584,6 +640,10 @@ def _collect_pb_intermediate_images(
 
 # ── Helpers: HTML components ──────────────────────────────────────────────────
 
+# Both helpers are pure functions of small hashable arguments and are called
+# on every rerun, so their HTML is memoised at module level.
+
+@functools.lru_cache(maxsize=256)
 def _dimbar(name: str, score: float, max_score: float = 4.0) -> str:
     pct = min(score / max_score * 100, 100)
     return (
@@ -599,12 +659,74 @@ def _dimbar(name: str, score: float, max_score: float = 4.0) -> str:
     )
 
 
+# Per-item lookups used by the result tabs — hoisted out of the render loops.
+_PILL_STYLE = {
+    "accept": ("pill-accept", "✓"),
+    "weak":   ("pill-weak",   "△"),
+    "reject": ("pill-reject", "✗"),
+}
+_IMPORTANCE_ICON = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+_DIAGRAM_BADGE = {
+    True:  '<span class="badge badge-gray">matplotlib fallback</span>',
+    False: '<span class="badge badge-green">PaperBanana</span>',
+}
+_DIAGRAM_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".svg": "image/svg+xml",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def _decision_pill(decision: str, score: float) -> str:
-    cls = "pill-accept" if score >= 6.5 else ("pill-weak" if score >= 4.5 else "pill-reject")
-    icon = "✓" if score >= 6.5 else ("△" if score >= 4.5 else "✗")
+    tier = "accept" if score >= 6.5 else ("weak" if score >= 4.5 else "reject")
+    cls, icon = _PILL_STYLE[tier]
     return f'<span class="decision-pill {cls}">{icon} {decision}</span>'
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_file_bytes(path: str, mtime_ns: int) -> bytes:
+    """Read a file once per (path, mtime) — the mtime key invalidates on rewrite."""
+    return Path(path).read_bytes()
+
+
+def _file_bytes(path: str | Path) -> bytes:
+    """Return the bytes of an output file, served from cache across reruns."""
+    return _cached_file_bytes(str(path), Path(path).stat().st_mtime_ns)
+
+
+# st.fragment (Streamlit ≥1.37) reruns only the decorated block on its own
+# widget events; older releases ship it as experimental_fragment or not at all.
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda fn: fn)
+)
+
+
+def _build_report_view(report) -> dict:
+    """Precompute the derived values the Results section renders.
+
+    Built once when a report lands in session state so reruns triggered by
+    unrelated widgets don't re-join author lists or re-filter equations.
+    """
+    content = report.extracted_content
+    authors = content.authors or []
+    authors_str = ", ".join(authors[:4])
+    if len(authors) > 4:
+        authors_str += f" +{len(authors) - 4} more"
+    display_eqs = [eq for eq in content.equations if not eq.is_inline]
+    return {
+        "authors_str": authors_str,
+        "n_eq": len(display_eqs),
+        "n_tab": len(content.tables),
+        "n_fig": len(content.figures),
+        "n_ref": len(content.references),
+        "display_eqs": display_eqs[:15],
+    }
+
+
 # ── Server Management helpers ─────────────────────────────────────────────────
 
 _SERVICES: dict[str, dict] = {
@@ -1887,7 +2009,7 @@ if run_clicked:
             ("HF_TOKEN",       hf_token),
         ]:
             if val:
-                os.environ[env_key] = val
+                _set_env(env_key, val)
 
         config = Config.load()
         if _should_skip_ssl():
@@ -1930,7 +2052,10 @@ if run_clicked:
             tmp_path = Path(temp_dir) / "uploads"
             tmp_path.mkdir(parents=True, exist_ok=True)
             file_path = tmp_path / uploaded_file.name
-            file_path.write_bytes(uploaded_file.read())
+            # Stream in 1 MiB chunks rather than materialising the whole PDF.
+            uploaded_file.seek(0)
+            with open(file_path, "wb") as fh:
+                shutil.copyfileobj(uploaded_file, fh, length=1024 * 1024)
             source = str(file_path)
         elif not source:
             # Path text input fallback (reliable inside pywebview app window)
@@ -1982,13 +2107,25 @@ if run_clicked:
                 _state["progress"].append((pct, msg))
 
             try:
-                t0 = _tm.time()
+                t0 = _tm.monotonic()
 
                 # Stage 1 — fetch PDF
                 _push(5,  "⬇️  Fetching PDF…")
                 _det = _analyser.input_handler.detect_source_type(_src)
                 _pi  = PaperInput(source_type=_det, source_value=_src, analysis_options=_opts)
+
+                # Load the OCR model while the PDF downloads.  The warmup gets
+                # its own thread and loop: _aio.run() waits for its executor
+                # threads on exit, so a warmup on the fetch loop would hold a
+                # failed download's error back until the model had loaded,
+                # even when cancelled.  Joined only once the PDF is in hand.
+                _warm = _threading.Thread(
+                    target=lambda: _aio.run(_analyser.ocr_engine.warmup()),
+                    name="ocr-warmup", daemon=True,
+                )
+                _warm.start()
                 _pdf = _aio.run(_analyser.input_handler.resolve(_pi))
+                _warm.join()
                 _push(10, f"✓  PDF ready — {_pdf.name}")
 
                 # Stage 2 — OCR
@@ -2001,11 +2138,12 @@ if run_clicked:
                 ))
 
                 # Store partial so the UI can show results while parallel tasks run
+                _meth, _res_sum, _concl = _analyser._extract_summaries(_cnt)
                 _state["partial"] = {
                     "content":    _cnt,
                     "paper_input": _pi,
-                    "methodology": _analyser._extract_methodology_summary(_cnt),
-                    "results_sum": _analyser._extract_results_summary(_cnt),
+                    "methodology": _meth,
+                    "results_sum": _res_sum,
                 }
 
                 # Stage 3 — parallel: diagrams + peer review
@@ -2046,16 +2184,16 @@ if run_clicked:
                 _sum = PaperSummary(
                     one_sentence=f"Analysis of '{_cnt.title}'",
                     abstract_summary=_cnt.abstract[:500] if _cnt.abstract else "",
-                    methodology_summary=_analyser._extract_methodology_summary(_cnt),
-                    results_summary=_analyser._extract_results_summary(_cnt),
-                    conclusions=_analyser._extract_conclusions(_cnt),
+                    methodology_summary=_meth,
+                    results_summary=_res_sum,
+                    conclusions=_concl,
                 )
                 _kp  = _analyser._extract_key_points(_cnt, review)
                 _meta_obj = ReportMetadata(
                     ocr_model=_cfg.ocr.model,
                     diagram_provider=_cfg.diagrams.provider,
                     review_model=_cfg.review.model,
-                    processing_time_seconds=_tm.time() - t0,
+                    processing_time_seconds=_tm.monotonic() - t0,
                 )
                 _rep = AnalysisReport(
                     paper_input=_pi, extracted_content=_cnt, review=review,
@@ -2276,6 +2414,7 @@ if _bg is not None:
             st.error(f"Analysis failed:\n\n{_bg['error']}")
         else:
             st.session_state["last_report"]         = _bg["report"]
+            st.session_state["last_report_view"]    = _build_report_view(_bg["report"])
             st.session_state["last_output_dir"]     = _bg_meta.get("output_dir", _DEFAULT_OUTPUT)
             st.session_state["last_generate_audio"] = _bg_meta.get("generate_audio", False)
             st.session_state["last_generate_storm"] = _bg_meta.get("generate_storm", False)
@@ -2323,6 +2462,7 @@ if report is None:
             else:
                 st.session_state["last_output_dir"] = str(_restored)
                 st.session_state.pop("last_report", None)
+                st.session_state.pop("last_report_view", None)
                 st.rerun()
     with _restore_bar_c2:
         st.caption("Reload the newest saved analysis results from disk if in-memory state was cleared.")
@@ -2387,14 +2527,15 @@ if report:
 
     st.markdown('<p class="sec-label">Results</p>', unsafe_allow_html=True)
 
+    _view = st.session_state.get("last_report_view")
+    if _view is None:
+        _view = st.session_state["last_report_view"] = _build_report_view(report)
+
     # Paper card
-    authors_str = ", ".join(report.extracted_content.authors[:4]) if report.extracted_content.authors else ""
-    if len(report.extracted_content.authors) > 4:
-        authors_str += f" +{len(report.extracted_content.authors) - 4} more"
     st.markdown(
         f'<div class="paper-card">'
         f'  <p class="paper-title">{report.extracted_content.title}</p>'
-        f'  <p class="paper-meta">{authors_str}</p>'
+        f'  <p class="paper-meta">{_view["authors_str"]}</p>'
         f'</div>',
         unsafe_allow_html=True,
     )
@@ -2402,11 +2543,10 @@ if report:
     # Stats row — Equations counts display-only (numbered equations in the paper);
     # inline variable mentions ($x$, $n$, etc.) are excluded from the headline number.
     m1, m2, m3, m4 = st.columns(4)
-    _n_display_eqs = sum(1 for eq in report.extracted_content.equations if not eq.is_inline)
-    m1.metric("Equations",  _n_display_eqs)
-    m2.metric("Tables",     len(report.extracted_content.tables))
-    m3.metric("Figures",    len(report.extracted_content.figures))
-    m4.metric("References", len(report.extracted_content.references))
+    m1.metric("Equations",  _view["n_eq"])
+    m2.metric("Tables",     _view["n_tab"])
+    m3.metric("Figures",    _view["n_fig"])
+    m4.metric("References", _view["n_ref"])
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -2469,7 +2609,7 @@ if report:
         if report.key_points:
             st.markdown('<p class="sec-label">Key Findings</p>', unsafe_allow_html=True)
             for kp in report.key_points:
-                icon = "🔴" if kp.importance == "high" else "🟡"
+                icon = _IMPORTANCE_ICON.get(kp.importance, "🟡")
                 with st.expander(f"{icon}  {kp.point}"):
                     st.markdown(f"**Evidence:** {kp.evidence}")
                     st.markdown(f'<span class="paper-chip">{kp.section}</span>', unsafe_allow_html=True)
@@ -2477,9 +2617,9 @@ if report:
     # ── Equations tab ─────────────────────────────────────────────────────────
     with tabs[tab_idx]:
         tab_idx += 1
-        display_eqs = [e for e in report.extracted_content.equations if not e.is_inline]
+        display_eqs = _view["display_eqs"]
         if display_eqs:
-            for eq in display_eqs[:15]:
+            for eq in display_eqs:
                 with st.expander(f"**{eq.label or eq.id}**  ·  {eq.section}"):
                     st.latex(eq.latex)
                     if eq.description:
@@ -2503,27 +2643,30 @@ if report:
             cols = st.columns(min(len(report.diagrams), 2), gap="medium")
             for i, diagram in enumerate(report.diagrams):
                 with cols[i % 2]:
-                    _is_fb = getattr(diagram, "is_fallback", False)
-                    _badge = (
-                        '<span class="badge badge-gray">matplotlib fallback</span>'
-                        if _is_fb else
-                        '<span class="badge badge-green">PaperBanana</span>'
-                    )
+                    _is_fb = bool(getattr(diagram, "is_fallback", False))
+                    _badge = _DIAGRAM_BADGE[_is_fb]
                     st.markdown(
                         f'<span class="paper-chip">{diagram.diagram_type.title()}</span> {_badge}',
                         unsafe_allow_html=True,
                     )
                     if Path(diagram.image_path).exists():
-                        st.image(diagram.image_path, caption=diagram.caption, use_container_width=True)
-                        with open(diagram.image_path, "rb") as _diag_fh:
-                            _dl_button(
-                                "⬇  Save / Download PNG",
-                                _diag_fh.read(),
-                                file_name=f"diagram_{diagram.diagram_type}.png",
-                                mime="application/octet-stream",
-                                use_container_width=True,
-                                key=f"_dl_diag_{i}",
-                            )
+                        _diag_bytes = _file_bytes(diagram.image_path)
+                        _diag_ext = Path(diagram.image_path).suffix.lower() or ".png"
+                        # st.image decodes raw bytes with PIL, which cannot read
+                        # SVG; hand it the markup as a string instead.
+                        st.image(
+                            _diag_bytes.decode() if _diag_ext == ".svg" else _diag_bytes,
+                            caption=diagram.caption,
+                            use_container_width=True,
+                        )
+                        _dl_button(
+                            f"⬇  Save / Download {_diag_ext[1:].upper()}",
+                            _diag_bytes,
+                            file_name=f"diagram_{diagram.diagram_type}{_diag_ext}",
+                            mime=_DIAGRAM_MIME.get(_diag_ext, "application/octet-stream"),
+                            use_container_width=True,
+                            key=f"_dl_diag_{i}",
+                        )
                     else:
                         st.info(f"Saved: `{diagram.image_path}`")
 
@@ -2556,29 +2699,33 @@ if report:
                     unsafe_allow_html=True,
                 )
                 st.markdown("<br>", unsafe_allow_html=True)
-                st.markdown(_decision_pill(decision, score), unsafe_allow_html=True)
+                st.markdown(_decision_pill(decision, round(score, 1)), unsafe_allow_html=True)
                 st.markdown("<br>", unsafe_allow_html=True)
                 st.metric("Confidence", f"{report.review.confidence:.0f} / 5")
 
             with dims_col:
                 st.markdown('<p class="sec-label">Dimensional Scores</p>', unsafe_allow_html=True)
-                bars_html = ""
-                for dim_name, dim in report.review.dimensions.items():
-                    bars_html += _dimbar(dim.name, dim.score)
+                # Bars show one decimal place — round so reruns hit the cache.
+                bars_html = "".join(
+                    _dimbar(dim.name, round(dim.score, 1))
+                    for dim in report.review.dimensions.values()
+                )
                 st.markdown(bars_html, unsafe_allow_html=True)
 
             sw1, sw2 = st.columns(2, gap="medium")
             with sw1:
                 st.markdown('<p class="sec-label">Strengths</p>', unsafe_allow_html=True)
-                sw_html = ""
-                for s in report.review.strengths:
-                    sw_html += f'<div class="sw-row"><span class="sw-icon">✅</span>{s}</div>'
+                sw_html = "".join(
+                    f'<div class="sw-row"><span class="sw-icon">✅</span>{s}</div>'
+                    for s in report.review.strengths
+                )
                 st.markdown(sw_html, unsafe_allow_html=True)
             with sw2:
                 st.markdown('<p class="sec-label">Weaknesses</p>', unsafe_allow_html=True)
-                sw_html = ""
-                for w in report.review.weaknesses:
-                    sw_html += f'<div class="sw-row"><span class="sw-icon">⚠️</span>{w}</div>'
+                sw_html = "".join(
+                    f'<div class="sw-row"><span class="sw-icon">⚠️</span>{w}</div>'
+                    for w in report.review.weaknesses
+                )
                 st.markdown(sw_html, unsafe_allow_html=True)
         else:
             st.info("Peer review was not requested for this run.")
@@ -2586,13 +2733,14 @@ if report:
     # ── Downloads tab ─────────────────────────────────────────────────────────
     with tabs[tab_idx]:
         tab_idx += 1
-        report_md = report.to_markdown()
-        import datetime as _dt
-        def _json_serial(obj):
-            if isinstance(obj, (_dt.datetime, _dt.date)):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj).__name__} not serializable")
-        report_json = json.dumps(report.to_json(), indent=2, ensure_ascii=False, default=_json_serial)
+        # Both payloads depend only on the report, so render them once and keep
+        # them in the per-report view instead of rebuilding on every rerun.
+        report_md = _view.get("report_md")
+        if report_md is None:
+            report_md = _view["report_md"] = report.to_markdown()
+        report_json = _view.get("report_json")
+        if report_json is None:
+            report_json = _view["report_json"] = _report_json_text(report)
 
         st.markdown('<p class="sec-label">Report files</p>', unsafe_allow_html=True)
         _dl_row1, _dl_row2 = st.columns(2, gap="medium")
@@ -2620,8 +2768,7 @@ if report:
         storm_file = Path(output_dir) / "storm_report.md"
         if _gen_audio and audio_file.exists():
             st.markdown("---")
-            with open(audio_file, "rb") as af:
-                _audio_bytes = af.read()
+            _audio_bytes = _file_bytes(audio_file)
             with st.container(border=True):
                 st.markdown("**Audio Narration (WAV)**")
                 st.caption("TTS narration of the analysis")
@@ -2650,14 +2797,13 @@ if report:
             audio_file = Path(output_dir) / "analysis_audio.wav"
             if audio_file.exists():
                 st.audio(str(audio_file), format="audio/wav")
-                with open(audio_file, "rb") as af:
-                    _dl_button(
-                        "⬇  Download WAV",
-                        af.read(),
-                        file_name="analysis_audio.wav",
-                        mime="application/octet-stream",
-                        use_container_width=True,
-                    )
+                _dl_button(
+                    "⬇  Download WAV",
+                    _file_bytes(audio_file),
+                    file_name="analysis_audio.wav",
+                    mime="application/octet-stream",
+                    use_container_width=True,
+                )
             else:
                 st.warning(
                     "Audio narration was not generated. Common causes:\n"
@@ -2711,86 +2857,95 @@ if report is None and _saved_report_md_text:
             )
 
 # ── PaperReview.ai Comparison ─────────────────────────────────────────────────
-st.divider()
-st.markdown('<p class="sec-label">External Comparison</p>', unsafe_allow_html=True)
+# Runs as a fragment so interacting with the uploader only reruns this block,
+# not the whole Results tabset above it.
 
-with st.container(border=True):
-    st.markdown(
-        '<div class="cfg-hdr"><div class="cfg-icon cfg-icon-diag">📊</div>'
-        'PaperReview.ai Score Comparison</div>',
-        unsafe_allow_html=True,
-    )
-    st.caption(
-        "Upload a review JSON from [PaperReview.ai](https://paperreview.ai) to compare scores. "
-        'Expected format: `{"overall_score": 6.9, "soundness": 3.1, "presentation": 3.0, "contribution": 3.2, "confidence": 3.5}`'
-    )
+@_fragment
+def _comparison_block() -> None:
+    st.divider()
+    st.markdown('<p class="sec-label">External Comparison</p>', unsafe_allow_html=True)
 
-    ext_file = st.file_uploader(
-        "Upload external review (JSON)",
-        type=["json"],
-        key="external_review",
-        label_visibility="collapsed",
-    )
+    with st.container(border=True):
+        st.markdown(
+            '<div class="cfg-hdr"><div class="cfg-icon cfg-icon-diag">📊</div>'
+            'PaperReview.ai Score Comparison</div>',
+            unsafe_allow_html=True,
+        )
+        st.caption(
+            "Upload a review JSON from [PaperReview.ai](https://paperreview.ai) to compare scores. "
+            'Expected format: `{"overall_score": 6.9, "soundness": 3.1, "presentation": 3.0, "contribution": 3.2, "confidence": 3.5}`'
+        )
 
-if ext_file is not None:
-    try:
-        from research_analyser.comparison import ReviewSnapshot, build_comparison_markdown, parse_local_review
-        from research_analyser.reviewer import interpret_score  # deferred
-
-        ext_data = json.loads(ext_file.getvalue().decode("utf-8"))
-        external = ReviewSnapshot(
-            source=f"paperreview.ai:{ext_file.name}",
-            overall_score=ext_data.get("overall_score") or ext_data.get("review_score") or ext_data.get("overall"),
-            soundness=ext_data.get("soundness"),
-            presentation=ext_data.get("presentation"),
-            contribution=ext_data.get("contribution"),
-            confidence=ext_data.get("confidence"),
+        ext_file = st.file_uploader(
+            "Upload external review (JSON)",
+            type=["json"],
+            key="external_review",
+            label_visibility="collapsed",
         )
 
-        st.markdown('<p class="sec-label">External Review Scores</p>', unsafe_allow_html=True)
-        ec = st.columns(5)
-        ec[0].metric("Overall",      f"{external.overall_score:.1f}/10"  if external.overall_score  else "—")
-        ec[1].metric("Soundness",    f"{external.soundness:.1f}/4"        if external.soundness       else "—")
-        ec[2].metric("Presentation", f"{external.presentation:.1f}/4"     if external.presentation    else "—")
-        ec[3].metric("Contribution", f"{external.contribution:.1f}/4"     if external.contribution    else "—")
-        ec[4].metric("Confidence",   f"{external.confidence:.1f}/5"       if external.confidence      else "—")
+    if ext_file is not None:
+        try:
+            from research_analyser.comparison import ReviewSnapshot, build_comparison_markdown, parse_local_review
+            from research_analyser.reviewer import interpret_score  # deferred
 
-        if external.overall_score is not None:
-            st.markdown(
-                _decision_pill(interpret_score(external.overall_score), external.overall_score),
-                unsafe_allow_html=True,
+            ext_data = _json_loads(ext_file.getvalue())
+            external = ReviewSnapshot(
+                source=f"paperreview.ai:{ext_file.name}",
+                overall_score=ext_data.get("overall_score") or ext_data.get("review_score") or ext_data.get("overall"),
+                soundness=ext_data.get("soundness"),
+                presentation=ext_data.get("presentation"),
+                contribution=ext_data.get("contribution"),
+                confidence=ext_data.get("confidence"),
             )
 
-        cur_report  = st.session_state.get("last_report")
-        cur_out_dir = st.session_state.get("last_output_dir", _cfg("output_dir", _DEFAULT_OUTPUT))
-        if cur_report and cur_report.review:
-            review = cur_report.review
-            dims   = review.dimensions or {}
-            local  = ReviewSnapshot(
-                source="local",
-                overall_score=review.overall_score,
-                soundness=dims.get("soundness").score if dims.get("soundness") else None,
-                presentation=dims.get("presentation").score if dims.get("presentation") else None,
-                contribution=dims.get("contribution").score if dims.get("contribution") else None,
-                confidence=review.confidence,
+            st.markdown('<p class="sec-label">External Review Scores</p>', unsafe_allow_html=True)
+            ec = st.columns(5)
+            ec[0].metric("Overall",      f"{external.overall_score:.1f}/10"  if external.overall_score  else "—")
+            ec[1].metric("Soundness",    f"{external.soundness:.1f}/4"        if external.soundness       else "—")
+            ec[2].metric("Presentation", f"{external.presentation:.1f}/4"     if external.presentation    else "—")
+            ec[3].metric("Contribution", f"{external.contribution:.1f}/4"     if external.contribution    else "—")
+            ec[4].metric("Confidence",   f"{external.confidence:.1f}/5"       if external.confidence      else "—")
+
+            if external.overall_score is not None:
+                st.markdown(
+                    _decision_pill(interpret_score(external.overall_score), round(external.overall_score, 1)),
+                    unsafe_allow_html=True,
+                )
+
+            cur_report  = st.session_state.get("last_report")
+            cur_out_dir = st.session_state.get("last_output_dir", _cfg("output_dir", _DEFAULT_OUTPUT))
+            if cur_report and cur_report.review:
+                review = cur_report.review
+                dims   = review.dimensions or {}
+                local  = ReviewSnapshot(
+                    source="local",
+                    overall_score=review.overall_score,
+                    soundness=dims.get("soundness").score if dims.get("soundness") else None,
+                    presentation=dims.get("presentation").score if dims.get("presentation") else None,
+                    contribution=dims.get("contribution").score if dims.get("contribution") else None,
+                    confidence=review.confidence,
+                )
+            else:
+                local = parse_local_review(Path(cur_out_dir))
+
+            st.markdown('<p class="sec-label">Comparison</p>', unsafe_allow_html=True)
+            comparison_md = build_comparison_markdown(local, external)
+            st.markdown(comparison_md)
+            _dl_button(
+                "⬇  Download Comparison (Markdown)",
+                comparison_md,
+                file_name="review_comparison.md",
+                mime="application/octet-stream",
             )
-        else:
-            local = parse_local_review(Path(cur_out_dir))
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+            st.error("Invalid JSON — please upload a valid review JSON file.")
+        except Exception as e:  # noqa: BLE001  (shown in the UI)
+            st.error(f"Comparison failed: {e}")
+            st.exception(e)
+
+
+_comparison_block()
 
-        st.markdown('<p class="sec-label">Comparison</p>', unsafe_allow_html=True)
-        comparison_md = build_comparison_markdown(local, external)
-        st.markdown(comparison_md)
-        _dl_button(
-            "⬇  Download Comparison (Markdown)",
-            comparison_md,
-            file_name="review_comparison.md",
-            mime="application/octet-stream",
-        )
-    except json.JSONDecodeError:
-        st.error("Invalid JSON — please upload a valid review JSON file.")
-    except Exception as e:
-        st.error(f"Comparison failed: {e}")
-        st.exception(e)
 
 # ── Late CSS override (injected last so it beats Streamlit component CSS) ──────
 st.markdown("""
@@ -20,17 +20,30 @@ Subsequent launches skip straight to step 5.
 """
 from __future__ import annotations
 
+import collections
+import contextlib
+import functools
+import gzip
+import http.client
 import json
 import logging
 import os
+import queue
+import re
 import shutil
 import socket
 import subprocess
 import sys
 import tarfile
+import tempfile
+import threading
 import time
+import urllib.error
 import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import BinaryIO
 
 # ── Stable paths ──────────────────────────────────────────────────────────────
 _APP_SUPPORT    = Path.home() / ".researchanalyser"
@@ -40,9 +53,26 @@ _SETUP_MARKER   = _APP_SUPPORT / ".setup_v3_complete"
 _OUTPUT_DIR     = Path.home() / "ResearchAnalyserOutput"
 # Extracted standalone Python 3.12 (from the bundled tarball in the .app).
 _BUNDLED_PYTHON = _APP_SUPPORT / "python312"
-# Auto-update: live sources fetched from GitHub at each launch.
+# Preferred first: zstd decodes several times faster than gzip.
+_PYTHON_TARBALLS = ("python312.tar.zst", "python312.tar.gz")
+# Native gunzip candidates, fastest first (pigz via Homebrew if installed).
+_GUNZIP_BINS = ("/opt/homebrew/bin/pigz", "/usr/local/bin/pigz", "/usr/bin/gzip")
+_TAR_BUFSIZE    = 1 << 20
+# Stdlib trees the companion venv never imports; skipped during extraction.
+# ensurepip must stay — `python -m venv` uses it to install pip.
+_TAR_SKIP = re.compile(r"^python/lib/python3\.\d+/(?:test|idlelib|turtledemo)(?:/|$)")
+# Auto-update: live sources fetched from GitHub at launch (throttled).
 _SOURCES_DIR     = _APP_SUPPORT / "sources"
 _GITHUB_SHA_FILE = _APP_SUPPORT / ".github_sha"
+# Time of the last successful SHA check; the API is skipped until the update
+# interval (RESEARCH_ANALYSER_UPDATE_INTERVAL seconds, 0 = always) elapses.
+_LAST_CHECK_FILE = _APP_SUPPORT / ".last_check"
+_UPDATE_INTERVAL_DEFAULT = 1800
+_RELAUNCH_GRACE = 60
+# Per-file ETags from raw.githubusercontent.com, sent back as If-None-Match.
+_SOURCE_ETAGS_FILE = _APP_SUPPORT / ".source_etags.json"
+# Last verified interpreter from _find_python (path + mtime).
+_PYTHON_CACHE_FILE = _APP_SUPPORT / ".python_cache.json"
 _GITHUB_RAW_BASE = "https://raw.githubusercontent.com/kp-algomaster/Research_Analyser/main"
 _GITHUB_API_URL  = "https://api.github.com/repos/kp-algomaster/Research_Analyser/commits/main"
 _SOURCE_FILES = [
@@ -56,6 +86,7 @@ _SOURCE_FILES = [
     "research_analyser/diagram_generator.py",
     "research_analyser/exceptions.py",
     "research_analyser/input_handler.py",
+    "research_analyser/job_store.py",
     "research_analyser/models.py",
     "research_analyser/ocr_engine.py",
     "research_analyser/report_generator.py",
@@ -76,79 +107,351 @@ log = logging.getLogger(__name__)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+@functools.cache
 def resource_path(relative: str) -> Path:
-    """Resolve a resource path for both frozen and dev modes."""
+    """Resolve a resource path for both frozen and dev modes (memoized)."""
     base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parents[1]))
     return base / relative
 
 
-def _find_free_port(start: int = 8502, end: int = 8600) -> int:
-    for port in range(start, end):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            try:
-                s.bind(("localhost", port))
-                return port
-            except OSError:
-                continue
-    return start
+def _find_free_port() -> int:
+    """Return a free localhost port chosen by the kernel.
+
+    Binding to port 0 hands out an unused ephemeral port in a single syscall
+    instead of probing 8502…8600 one socket at a time.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
 
 
-def _clean_env() -> dict:
+def _build_clean_env() -> dict:
     """Return os.environ without DYLD_* keys.
 
     PyInstaller sets DYLD_LIBRARY_PATH / DYLD_FRAMEWORK_PATH to point at
     bundled libraries.  When we spawn an external Python binary those vars
     cause it to load the WRONG dylibs (from the .app bundle) and crash or
     report the wrong version.  Strip them so subprocesses get a clean env.
+    PYINSTALLER_RESET_ENVIRONMENT tells any frozen child to start fresh
+    instead of reusing this process's bootloader state.
+    """
+    env = {k: v for k, v in os.environ.items() if not k.startswith("DYLD_")}
+    env["PYINSTALLER_RESET_ENVIRONMENT"] = "1"
+    return env
+
+
+# Built once — the launcher never changes its own environment.  Treat as
+# read-only; derive variants with dict(_CLEAN_ENV, **overrides).
+_CLEAN_ENV = _build_clean_env()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a sibling temp file + os.replace (crash-safe)."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _stream_atomic(path: Path, src: BinaryIO) -> None:
+    """Copy src into path in 64 KiB chunks, then os.replace into place.
+
+    A killed launcher leaves at worst a stray temp file, never a truncated
+    source, and the body is never held in memory as a whole.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.",
+                                     delete=False) as tmp:
+        try:
+            shutil.copyfileobj(src, tmp, length=1 << 16)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, path)
+
+
+def _drain(stream: BinaryIO) -> None:
+    """Consume trailing tar record padding so the producer isn't hit by EPIPE."""
+    while stream.read(_TAR_BUFSIZE):
+        pass
+
+
+@contextlib.contextmanager
+def _decompressed_stream(tarball: Path) -> Iterator[BinaryIO]:
+    """Yield a readable stream of the decompressed tar data.
+
+    Decompression always runs concurrently with the caller's tar writes:
+    .tar.zst is decoded by the zstandard module in a pump thread feeding an
+    OS pipe (zstandard releases the GIL while decoding); .tar.gz is handed to
+    a native pigz / gzip child process.  Python's gzip module is the last
+    resort when no binary is found.
     """
-    return {k: v for k, v in os.environ.items()
-            if not k.startswith("DYLD_")}
+    if tarball.suffix == ".zst":
+        import zstandard
+
+        read_fd, write_fd = os.pipe()
+        errors: list[BaseException] = []
+
+        def _pump() -> None:
+            try:
+                # Wrap write_fd first: if the open() fails, closing it still
+                # gives the reader EOF instead of blocking forever.
+                with os.fdopen(write_fd, "wb") as out, open(tarball, "rb") as fh:
+                    zstandard.ZstdDecompressor().copy_stream(
+                        fh, out, read_size=_TAR_BUFSIZE, write_size=_TAR_BUFSIZE
+                    )
+            except BaseException as exc:  # noqa: BLE001  (re-raised below)
+                errors.append(exc)
+
+        pump = threading.Thread(target=_pump, name="zstd-pump", daemon=True)
+        pump.start()
+        try:
+            with os.fdopen(read_fd, "rb", buffering=_TAR_BUFSIZE) as stream:
+                yield stream
+                _drain(stream)
+        finally:
+            # Closing the read end unblocks the pump (EPIPE) if we bailed out
+            # early; a decoder error is more useful than the tar error it caused.
+            pump.join()
+            if errors and not isinstance(errors[0], BrokenPipeError):
+                raise errors[0]
+        return
+
+    gunzip = next((b for b in _GUNZIP_BINS if os.path.isfile(b)), None)
+    if gunzip is None:
+        with gzip.open(tarball, "rb") as stream:
+            yield stream
+        return
+
+    proc = subprocess.Popen(
+        [gunzip, "-dc", str(tarball)],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        bufsize=_TAR_BUFSIZE, env=_CLEAN_ENV,
+    )
+    try:
+        yield proc.stdout
+        _drain(proc.stdout)
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode(errors="replace")
+        proc.stderr.close()
+        rc = proc.wait()
+    if rc != 0:
+        raise RuntimeError(f"{gunzip} -dc exited {rc}: {stderr.strip()[:200]}")
+
+
+def _extract_members(tar_path: Path, dest: Path, members: list[tarfile.TarInfo]) -> None:
+    """Extract *members* from a seekable tar using a private TarFile handle."""
+    with tarfile.open(tar_path, "r:", copybufsize=_TAR_BUFSIZE) as tf:
+        for member in members:
+            tf.extract(member, dest)
+
+
+def _extract_tarball(tarball: Path, dest: Path) -> None:
+    """Extract a .tar.zst or .tar.gz into dest, writing files in parallel.
+
+    The archive is first decompressed (concurrently, see _decompressed_stream)
+    into a plain .tar beside dest so it becomes seekable.  Regular files are
+    then spread across a thread pool, each worker seeking its own TarFile
+    handle to its members — the bundled Python is ~2 000 small files and the
+    writes are I/O-bound, so they overlap well.  Directories are created up
+    front (so workers never race on makedirs), links are made once their
+    targets exist, and directory modes/mtimes are applied last, as
+    extractall does.  Members matching _TAR_SKIP (the stdlib test suite,
+    IDLE, turtledemo) are never written.
+    """
+    with tempfile.NamedTemporaryFile(dir=dest.parent, prefix=".extract-",
+                                     suffix=".tar", delete=False) as tmp:
+        tar_path = Path(tmp.name)
+        try:
+            with _decompressed_stream(tarball) as stream:
+                shutil.copyfileobj(stream, tmp, length=_TAR_BUFSIZE)
+        except BaseException:
+            tmp.close()
+            tar_path.unlink(missing_ok=True)
+            raise
+
+    try:
+        with tarfile.open(tar_path, "r:", copybufsize=_TAR_BUFSIZE) as tf:
+            members = [m for m in tf.getmembers() if not _TAR_SKIP.match(m.name)]
+            dirs = [m for m in members if m.isdir()]
+            files = [m for m in members if m.isreg()]
+            others = [m for m in members if not (m.isdir() or m.isreg())]
+
+            for parent in {dest / m.name for m in dirs} | {
+                    (dest / m.name).parent for m in files + others}:
+                parent.mkdir(parents=True, exist_ok=True)
+
+            workers = min(8, os.cpu_count() or 1)
+            # Largest first, dealt round-robin, keeps the shards balanced.
+            files.sort(key=lambda m: m.size, reverse=True)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for fut in [pool.submit(_extract_members, tar_path, dest, files[i::workers])
+                            for i in range(workers)]:
+                    fut.result()
+
+            for member in others:
+                tf.extract(member, dest)
+            # Deepest first so a read-only parent can't block its children.
+            for member in sorted(dirs, key=lambda m: m.name, reverse=True):
+                tf.extract(member, dest)
+    finally:
+        tar_path.unlink(missing_ok=True)
 
 
 def _extract_bundled_python() -> str | None:
     """Extract the python-build-standalone tarball bundled in the .app.
 
-    The tarball (python312.tar.gz) is added to the bundle at build time via
-    PyInstaller --add-data.  Its internal structure is:
+    The tarball (python312.tar.zst, or python312.tar.gz from older builds) is
+    added to the bundle at build time via PyInstaller --add-data.  Its
+    internal structure is:
         python/
           bin/python3.12
           lib/…
           …
 
     We extract once to ~/.researchanalyser/python312/ and return the path to
-    the python3.12 binary.  Subsequent calls are instant (directory exists).
+    the python3.12 binary.  Subsequent calls are instant (binary exists); the
+    tree only appears under that name once extraction has fully succeeded.
     """
-    tarball = resource_path("python312.tar.gz")
-    if not tarball.exists():
-        log.warning("Bundled Python tarball not found at %s — will try system Python", tarball)
-        return None
-
+    # Checked first so warm launches never touch the bundle resources.
     py_bin = _BUNDLED_PYTHON / "python" / "bin" / "python3.12"
     if py_bin.exists():
         log.info("Bundled Python already extracted: %s", py_bin)
         return str(py_bin)
 
+    candidates = [resource_path(name) for name in _PYTHON_TARBALLS]
+    tarball = next((p for p in candidates if p.exists()), None)
+    if tarball is None:
+        log.warning("Bundled Python tarball not found at %s — will try system Python",
+                    candidates[-1])
+        return None
+
+    # Extract beside the target and rename it into place only once complete:
+    # a launch killed mid-extraction (or a full disk) must never leave a tree
+    # whose python3.12 exists and so passes the fast path above.
     log.info("Extracting bundled Python 3.12 to %s …", _BUNDLED_PYTHON)
-    _BUNDLED_PYTHON.mkdir(parents=True, exist_ok=True)
+    # The probe cache may point at the tree being replaced; re-probe afterwards.
+    _PYTHON_CACHE_FILE.unlink(missing_ok=True)
+    partial = _BUNDLED_PYTHON.with_name(f".{_BUNDLED_PYTHON.name}.partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir(parents=True)
     try:
-        with tarfile.open(tarball, "r:gz") as tf:
-            tf.extractall(_BUNDLED_PYTHON)
+        _extract_tarball(tarball, partial)
+        partial_bin = partial / "python" / "bin" / "python3.12"
+        if not partial_bin.exists():
+            log.error("python3.12 binary not found after extraction (expected %s)", py_bin)
+            shutil.rmtree(partial, ignore_errors=True)
+            return None
+        # Ensure the binary is executable (should be preserved by tarfile, but be safe)
+        partial_bin.chmod(0o755)
+        shutil.rmtree(_BUNDLED_PYTHON, ignore_errors=True)  # an incomplete older tree
+        os.replace(partial, _BUNDLED_PYTHON)
     except Exception as exc:
         log.error("Failed to extract bundled Python: %s", exc)
+        shutil.rmtree(partial, ignore_errors=True)
         return None
 
-    if not py_bin.exists():
-        log.error("python3.12 binary not found after extraction (expected %s)", py_bin)
-        return None
-
-    # Ensure the binary is executable (should be preserved by tarfile, but be safe)
-    py_bin.chmod(0o755)
     log.info("Bundled Python extracted successfully: %s", py_bin)
     return str(py_bin)
 
 
+_VERSION_RE = re.compile(r"\((\d+), (\d+)\)")
+
+# -I -S skips site and user paths, so the probe stays cheap, but importing
+# encodings still needs a working stdlib (--version answers without one).
+_PROBE_CODE = "import sys, encodings; print(sys.version_info[:2])"
+
+
+def _verify_python(path: str, env: dict) -> bool:
+    """Return True if path is a runnable Python 3.10+ executable.
+
+    The interpreter must start up and import from its stdlib, so a
+    half-extracted or stdlib-less install is rejected here, not later in
+    `python -m venv`.
+    """
+    try:
+        r = subprocess.run([path, "-I", "-S", "-c", _PROBE_CODE], capture_output=True,
+                           text=True, timeout=10, env=env)
+        out = r.stdout.strip()
+        log.debug("_verify %s → rc=%s out=%r", path, r.returncode, out)
+        m = _VERSION_RE.fullmatch(out)
+        return r.returncode == 0 and m is not None and (
+            int(m.group(1)), int(m.group(2))) >= (3, 10)
+    except (OSError, subprocess.SubprocessError) as exc:
+        log.debug("_verify %s raised: %s", path, exc)
+        return False
+
+
+def _first_verified(paths: list[str], env: dict) -> str | None:
+    """Probe all existing paths concurrently; return the first that passes.
+
+    Results are consumed in list order so priority is unchanged — a later
+    candidate never wins just because its probe finished first.
+    """
+    existing = [p for p in paths if os.path.isfile(p)]
+    log.debug("Probing %d of %d candidate paths: %s", len(existing), len(paths), existing)
+    if not existing:
+        return None
+    pool = ThreadPoolExecutor(max_workers=min(8, len(existing)))
+    try:
+        futures = [pool.submit(_verify_python, p, env) for p in existing]
+        for path, fut in zip(existing, futures):
+            if fut.result():
+                return path
+        return None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _load_cached_python() -> str | None:
+    """Return the interpreter recorded by a previous probe if it is unchanged.
+
+    The cache stores the path and its st_mtime_ns; an upgrade or removal of
+    the interpreter changes/invalidates the stat and forces a fresh probe.
+    A matching entry is still run once through _verify_python, which imports
+    from the stdlib, so an interpreter broken underneath an unchanged binary
+    (e.g. a removed Homebrew keg) is caught here rather than when the venv is
+    created.
+    """
+    try:
+        data = json.loads(_PYTHON_CACHE_FILE.read_text())
+        path = data["path"]
+        if os.stat(path).st_mtime_ns != data["mtime_ns"]:
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if _verify_python(path, _CLEAN_ENV):
+        return path
+    log.info("Cached Python %s failed verification — re-probing", path)
+    return None
+
+
 def _find_python() -> str | None:
+    """Return a Python 3.10+ interpreter, reusing the last probe's result.
+
+    Probing can fork up to ~20 interpreters plus login shells; the verified
+    path is remembered in _PYTHON_CACHE_FILE so later setups skip all of it.
+    """
+    cached = _load_cached_python()
+    if cached:
+        log.info("Using cached Python: %s", cached)
+        return cached
+
+    path = _probe_python()
+    if path:
+        try:
+            _write_atomic(_PYTHON_CACHE_FILE, json.dumps(
+                {"path": path, "mtime_ns": os.stat(path).st_mtime_ns}
+            ).encode())
+        except OSError as exc:
+            log.debug("Could not write Python cache: %s", exc)
+    return path
+
+
+_LOGIN_SHELL_PY_NAMES = ("python3.13", "python3.12", "python3.11", "python3.10", "python3")
+
+
+def _probe_python() -> str | None:
     """Return the path to a Python 3.10+ interpreter.
 
     macOS apps launched from Finder have a stripped PATH (/usr/bin:/bin only)
@@ -163,26 +466,11 @@ def _find_python() -> str | None:
     2. Login shell (zsh -l) — loads ~/.zprofile so non-standard installs
        (pyenv, conda, custom prefix) are found via the user's PATH.
     """
-    _env = _clean_env()
-
-    def _verify(path: str) -> bool:
-        """Return True if path is a Python 3.10+ executable."""
-        try:
-            r = subprocess.run(
-                [path, "-c",
-                 "import sys; v=sys.version_info; print(v.major*100+v.minor)"],
-                capture_output=True, text=True, timeout=10, env=_env,
-            )
-            log.debug("_verify %s → rc=%s out=%r", path, r.returncode,
-                      r.stdout.strip())
-            return r.returncode == 0 and int(r.stdout.strip()) >= 310
-        except Exception as exc:
-            log.debug("_verify %s raised: %s", path, exc)
-            return False
+    _env = _CLEAN_ENV
 
     # ── 0. Bundled Python (no system dependency required) ────────────────────
     bundled = _extract_bundled_python()
-    if bundled and _verify(bundled):
+    if bundled and _verify_python(bundled, _env):
         log.info("Using bundled Python 3.12: %s", bundled)
         return bundled
 
@@ -205,34 +493,33 @@ def _find_python() -> str | None:
         "/Library/Frameworks/Python.framework/Versions/3.11/bin/python3.11",
         "/usr/bin/python3",
     ]
-    for path in candidates:
-        log.debug("Checking absolute path: %s (exists=%s)", path,
-                  os.path.isfile(path))
-        if os.path.isfile(path) and _verify(path):
-            log.info("Found Python at absolute path: %s", path)
-            return path
+    path = _first_verified(candidates, _env)
+    if path:
+        log.info("Found Python at absolute path: %s", path)
+        return path
 
     # ── 2. Login shell fallback (pyenv / conda / custom prefix) ──────────────
-    for shell in ("/bin/zsh", "/bin/bash"):
-        if not os.path.isfile(shell):
-            continue
-        for py_name in ("python3.13", "python3.12", "python3.11", "python3.10",
-                        "python3"):
-            try:
-                r = subprocess.run(
-                    [shell, "-l", "-c", f"which {py_name}"],
-                    capture_output=True, text=True, timeout=20, env=_env,
-                )
-                log.debug("shell which %s → rc=%s out=%r err=%r",
-                          py_name, r.returncode, r.stdout.strip(),
-                          r.stderr.strip()[:100])
-                path = r.stdout.strip().splitlines()[0] if r.returncode == 0 else ""
-                if path and os.path.isfile(path) and _verify(path):
-                    log.info("Found Python via %s login shell: %s", shell, path)
-                    return path
-            except Exception as exc:
-                log.debug("shell search %s/%s raised: %s", shell, py_name, exc)
-                continue
+    # One login shell resolves every name (sourcing ~/.zprofile once, not
+    # per name); bash is only used when zsh is absent.
+    shell = next((sh for sh in ("/bin/zsh", "/bin/bash") if os.path.isfile(sh)), None)
+    if shell:
+        names = " ".join(_LOGIN_SHELL_PY_NAMES)
+        try:
+            r = subprocess.run(
+                [shell, "-l", "-c", f"for n in {names}; do command -v $n; done"],
+                capture_output=True, text=True, timeout=20, env=_env,
+            )
+            log.debug("%s command -v → rc=%s out=%r err=%r", shell, r.returncode,
+                      r.stdout.strip(), r.stderr.strip()[:100])
+            found = list(dict.fromkeys(
+                line for line in r.stdout.splitlines() if line.startswith("/")
+            ))
+            path = _first_verified(found, _env)
+            if path:
+                log.info("Found Python via %s login shell: %s", shell, path)
+                return path
+        except (OSError, subprocess.SubprocessError) as exc:
+            log.debug("shell search via %s raised: %s", shell, exc)
 
     log.error("No Python 3.10+ found — checked %d absolute paths + login shell",
               len(candidates))
@@ -240,34 +527,118 @@ def _find_python() -> str | None:
 
 
 def _wait_for_server(port: int, timeout: int = 120) -> bool:
-    """Poll until Streamlit's health endpoint responds."""
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        try:
-            with urllib.request.urlopen(
-                f"http://localhost:{port}/_stcore/health", timeout=1
-            ) as r:
-                if r.status == 200:
+    """Poll until Streamlit is accepting connections and reports healthy.
+
+    One keep-alive HTTPConnection is reused across probes: while the port is
+    closed each attempt is just a refused connect, and once it opens the
+    health request rides the same socket.  Polling backs off 25 ms → 250 ms
+    so a fast start is noticed almost immediately.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.025
+    conn = http.client.HTTPConnection("localhost", port, timeout=1)
+    try:
+        while time.monotonic() < deadline:
+            try:
+                conn.request("GET", "/_stcore/health")
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status == 200:
                     return True
-        except Exception:
-            pass
-        time.sleep(0.3)
-    return False
+            except (OSError, http.client.HTTPException):
+                conn.close()  # reconnects on the next request
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.25)
+        return False
+    finally:
+        conn.close()
 
 
 # ── Auto-update: fetch latest sources from GitHub ─────────────────────────────
 
+_SOURCE_FETCH_WORKERS = 8
+
+
+def _load_source_etags() -> dict[str, str]:
+    try:
+        return json.loads(_SOURCE_ETAGS_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _fetch_source_file(rel_path: str, etag: str | None = None) -> tuple[bool, str | None]:
+    """Download one file from GitHub main into _SOURCES_DIR.
+
+    Sends If-None-Match when a cached copy and its ETag exist, so unchanged
+    files cost a header-only 304.  Returns (ok, etag) where etag is the value
+    to remember for next time.
+    """
+    url = f"{_GITHUB_RAW_BASE}/{rel_path}"
+    dest = _SOURCES_DIR / rel_path
+    headers = {"User-Agent": "ResearchAnalyser-Launcher"}
+    if etag and dest.exists():
+        headers["If-None-Match"] = etag
+    try:
+        file_req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(file_req, timeout=10) as resp:
+            _stream_atomic(dest, resp)
+            new_etag = resp.headers.get("ETag")
+        log.debug("Updated %s", rel_path)
+        return True, new_etag
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            log.debug("Unchanged %s (304)", rel_path)
+            return True, etag
+        log.warning("Failed to download %s: %s", rel_path, exc)
+    except Exception as exc:  # noqa: BLE001  (one bad file must not stop the update)
+        log.warning("Failed to download %s: %s", rel_path, exc)
+    return False, None
+
+
+def _update_interval() -> int:
+    raw = os.environ.get("RESEARCH_ANALYSER_UPDATE_INTERVAL", "")
+    try:
+        return max(0, int(raw)) if raw else _UPDATE_INTERVAL_DEFAULT
+    except ValueError:
+        log.warning("Ignoring invalid RESEARCH_ANALYSER_UPDATE_INTERVAL=%r", raw)
+        return _UPDATE_INTERVAL_DEFAULT
+
+
+def _checked_recently() -> bool:
+    """True if the last SHA check is younger than the update interval.
+
+    A rapid relaunch (within _RELAUNCH_GRACE seconds) is always treated as
+    recent unless the interval is 0, which disables the throttle entirely.
+    """
+    interval = _update_interval()
+    if interval == 0:
+        return False
+    try:
+        last = float(_LAST_CHECK_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    return time.time() - last < max(interval, _RELAUNCH_GRACE)
+
+
 def _auto_update_sources() -> Path | None:
     """Fetch the latest source files from GitHub main and cache them locally.
 
-    On every launch we query the latest commit SHA via the GitHub API (3 s
+    On launch we query the latest commit SHA via the GitHub API (3 s
     timeout).  If the SHA matches the last-downloaded value, nothing is fetched
     — the cached sources directory is returned immediately.  On a new commit we
-    download all files in _SOURCE_FILES and update the SHA marker.
+    re-fetch every file in _SOURCE_FILES with a conditional GET (only changed
+    files transfer a body) and update the SHA marker.
+
+    The API call itself is skipped while a cached copy exists and the last
+    check is younger than the update interval (see _checked_recently).
 
     Returns the sources directory if usable (cached or freshly downloaded),
     or None if the network is unavailable and no local cache exists.
     """
+    if (_SOURCES_DIR / "app.py").exists() and _checked_recently():
+        log.info("Sources checked recently — skipping GitHub SHA check")
+        return _SOURCES_DIR
+
     try:
         req = urllib.request.Request(
             _GITHUB_API_URL,
@@ -279,6 +650,7 @@ def _auto_update_sources() -> Path | None:
         with urllib.request.urlopen(req, timeout=3) as resp:
             data = json.loads(resp.read())
         latest_sha = data.get("sha", "")[:12]
+        _write_atomic(_LAST_CHECK_FILE, str(time.time()).encode())
     except Exception as exc:
         log.warning("GitHub SHA check failed (%s) — using cached sources", exc)
         return _SOURCES_DIR if (_SOURCES_DIR / "app.py").exists() else None
@@ -289,28 +661,33 @@ def _auto_update_sources() -> Path | None:
         return _SOURCES_DIR
 
     log.info("New commit: %s → %s — updating sources…", stored_sha or "none", latest_sha)
-    _SOURCES_DIR.mkdir(parents=True, exist_ok=True)
-    (_SOURCES_DIR / "research_analyser").mkdir(parents=True, exist_ok=True)
+    # Create every destination directory up front so workers never race mkdir.
+    for parent in {(_SOURCES_DIR / rel).parent for rel in _SOURCE_FILES}:
+        parent.mkdir(parents=True, exist_ok=True)
 
+    # Files are independent and the fetch is latency-bound, so overlap them:
+    # wall time becomes roughly the slowest download instead of the sum.
+    etags = _load_source_etags()
     ok = fail = 0
-    for rel_path in _SOURCE_FILES:
-        url = f"{_GITHUB_RAW_BASE}/{rel_path}"
-        dest = _SOURCES_DIR / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            file_req = urllib.request.Request(
-                url, headers={"User-Agent": "ResearchAnalyser-Launcher"}
-            )
-            with urllib.request.urlopen(file_req, timeout=10) as resp:
-                dest.write_bytes(resp.read())
-            ok += 1
-            log.debug("Updated %s", rel_path)
-        except Exception as exc:
-            fail += 1
-            log.warning("Failed to download %s: %s", rel_path, exc)
+    with ThreadPoolExecutor(max_workers=_SOURCE_FETCH_WORKERS) as pool:
+        futures = {
+            pool.submit(_fetch_source_file, rel, etags.get(rel)): rel
+            for rel in _SOURCE_FILES
+        }
+        for fut in as_completed(futures):
+            success, etag = fut.result()
+            if success:
+                ok += 1
+            else:
+                fail += 1
+            if etag:
+                etags[futures[fut]] = etag
+            else:
+                etags.pop(futures[fut], None)
 
     if ok > 0:
-        _GITHUB_SHA_FILE.write_text(latest_sha)
+        _write_atomic(_SOURCE_ETAGS_FILE, json.dumps(etags).encode())
+        _write_atomic(_GITHUB_SHA_FILE, latest_sha.encode())
         log.info("Sources updated: %d OK / %d failed (SHA=%s)", ok, fail, latest_sha)
         return _SOURCES_DIR
 
@@ -319,48 +696,60 @@ def _auto_update_sources() -> Path | None:
 
 
 # ── Packages installed into the companion venv ────────────────────────────────
-# pip/wheel first so upgrades propagate; torch last (biggest download).
+# Installed in three pip invocations so the resolver runs once per batch rather
+# than once per package: pip/wheel first so upgrades propagate, then everything
+# from PyPI from a generated requirements file, then torch last (biggest
+# download, separate CPU wheel index).
+_BOOTSTRAP_PACKAGES = [
+    ("pip", "pip"),
+    ("wheel", "wheel"),
+]
 _PACKAGES = [
-    ("pip", ["install", "--upgrade", "pip"]),
-    ("wheel", ["install", "wheel"]),
-    ("python-dotenv", ["install", "python-dotenv>=1.0.0"]),
-    ("pydantic", ["install", "pydantic>=2.0"]),
-    ("pydantic-settings", ["install", "pydantic-settings>=2.0"]),
-    ("pyyaml", ["install", "pyyaml>=6.0"]),
-    ("aiohttp", ["install", "aiohttp>=3.9"]),
-    ("aiofiles", ["install", "aiofiles>=23.0"]),
-    ("httpx", ["install", "httpx>=0.25"]),
-    ("rich", ["install", "rich>=13.0"]),
-    ("click", ["install", "click>=8.1"]),
-    ("tqdm", ["install", "tqdm>=4.65"]),
-    ("Pillow", ["install", "Pillow>=10.0"]),
-    ("matplotlib", ["install", "matplotlib>=3.8"]),
-    ("soundfile", ["install", "soundfile>=0.12"]),
-    ("google-genai", ["install", "google-genai>=0.1.0"]),
-    ("google-generativeai", ["install", "google-generativeai>=0.8.0"]),
-    ("paperbanana", ["install", "paperbanana[dev,openai,google] @ git+https://github.com/llmsresearch/paperbanana.git"]),
-    ("huggingface_hub", ["install", "huggingface-hub>=0.23"]),
-    ("transformers", ["install", "transformers>=4.40"]),
-    ("accelerate", ["install", "accelerate>=0.30"]),
-    ("PyMuPDF", ["install", "PyMuPDF>=1.23"]),
-    ("streamlit", ["install", "streamlit>=1.30"]),
-    ("altair", ["install", "altair>=5"]),
-    ("fastapi", ["install", "fastapi>=0.100"]),
-    ("uvicorn", ["install", "uvicorn[standard]>=0.24"]),
-    ("python-multipart", ["install", "python-multipart>=0.0.6"]),
-    ("scikit-learn", ["install", "scikit-learn>=1.3"]),
-    ("langchain-core", ["install", "langchain-core>=0.2"]),
-    ("langchain", ["install", "langchain>=0.2"]),
-    ("langchain-openai", ["install", "langchain-openai>=0.1"]),
-    ("langchain-community", ["install", "langchain-community>=0.2"]),
-    ("langgraph", ["install", "langgraph>=0.2"]),
-    ("tavily-python", ["install", "tavily-python>=0.3"]),
-    ("knowledge-storm", ["install", "knowledge-storm>=1.0.0"]),
-    ("torch", ["install", "torch>=2.1", "--index-url",
-               "https://download.pytorch.org/whl/cpu"]),
-    ("torchvision", ["install", "torchvision>=0.16", "--index-url",
-                     "https://download.pytorch.org/whl/cpu"]),
+    ("python-dotenv", "python-dotenv>=1.0.0"),
+    ("pydantic", "pydantic>=2.0"),
+    ("pydantic-settings", "pydantic-settings>=2.0"),
+    ("pyyaml", "pyyaml>=6.0"),
+    ("aiohttp", "aiohttp>=3.9"),
+    ("aiofiles", "aiofiles>=23.0"),
+    ("httpx", "httpx>=0.25"),
+    ("rich", "rich>=13.0"),
+    ("click", "click>=8.1"),
+    ("tqdm", "tqdm>=4.65"),
+    ("Pillow", "Pillow>=10.0"),
+    ("matplotlib", "matplotlib>=3.8"),
+    ("soundfile", "soundfile>=0.12"),
+    ("google-genai", "google-genai>=0.1.0"),
+    ("google-generativeai", "google-generativeai>=0.8.0"),
+    ("paperbanana", "paperbanana[dev,openai,google] @ git+https://github.com/llmsresearch/paperbanana.git"),
+    ("huggingface_hub", "huggingface-hub>=0.23"),
+    ("transformers", "transformers>=4.40"),
+    ("accelerate", "accelerate>=0.30"),
+    ("PyMuPDF", "PyMuPDF>=1.23"),
+    ("streamlit", "streamlit>=1.30"),
+    ("orjson", "orjson>=3.9"),
+    ("altair", "altair>=5"),
+    ("fastapi", "fastapi>=0.100"),
+    ("uvicorn", "uvicorn[standard]>=0.24"),
+    ("python-multipart", "python-multipart>=0.0.6"),
+    ("scikit-learn", "scikit-learn>=1.3"),
+    ("langchain-core", "langchain-core>=0.2"),
+    ("langchain", "langchain>=0.2"),
+    ("langchain-openai", "langchain-openai>=0.1"),
+    ("langchain-community", "langchain-community>=0.2"),
+    ("langgraph", "langgraph>=0.2"),
+    ("tavily-python", "tavily-python>=0.3"),
+    ("knowledge-storm", "knowledge-storm>=1.0.0"),
+]
+_TORCH_INDEX_URL = "https://download.pytorch.org/whl/cpu"
+_TORCH_PACKAGES = [
+    ("torch", "torch>=2.1"),
+    ("torchvision", "torchvision>=0.16"),
 ]
+_REQUIREMENTS_FILE = _APP_SUPPORT / "requirements.txt"
+# Persistent pip cache (survives marker bumps / reinstalls) and a scratch dir
+# whose pypi/ and torch/ subdirs the two concurrent `pip download` runs fill.
+_PIP_CACHE_DIR = _APP_SUPPORT / "pip-cache"
+_WHEELS_DIR    = _APP_SUPPORT / "wheels"
 
 
 # ── Setup page HTML ───────────────────────────────────────────────────────────
@@ -469,7 +858,7 @@ def _launch_streamlit(
         return None
 
     env = {
-        **os.environ,
+        **_CLEAN_ENV,
         # Sources dir is first in PYTHONPATH so live code overrides the bundle.
         "PYTHONPATH": pythonpath,
         "RESEARCH_ANALYSER_OUTPUT_DIR": str(_OUTPUT_DIR),
@@ -484,6 +873,7 @@ def _launch_streamlit(
         # Streamlit runs as a child process and does NOT inherit sys._MEIPASS.
         "RA_BUNDLE_DIR": getattr(sys, "_MEIPASS", ""),
         "STREAMLIT_GLOBAL_DEVELOPMENT_MODE": "false",
+        "STREAMLIT_RUNNER_MAGIC_ENABLED": "false",
         # Dark theme — mirrors .streamlit/config.toml which Streamlit's subprocess
         # cannot find inside the frozen .app bundle.
         "STREAMLIT_THEME_BASE":                     "dark",
@@ -503,8 +893,12 @@ def _launch_streamlit(
     if config_file.exists():
         env["RESEARCH_ANALYSER_CONFIG"] = str(config_file)
 
+    # Call the CLI entry point directly rather than resolving `-m streamlit`
+    # through runpy on every launch.
     cmd = [
-        str(python), "-m", "streamlit", "run", str(app_script),
+        str(python), "-c",
+        "from streamlit.web.cli import main; main(prog_name='streamlit')",
+        "run", str(app_script),
         "--server.headless", "true",
         "--server.port", str(port),
         "--server.address", "localhost",
@@ -513,52 +907,249 @@ def _launch_streamlit(
         "--server.fileWatcherType", "none",
     ]
     log.info("Starting Streamlit subprocess …")
-    return subprocess.Popen(cmd, env=env,
+    # Own session: Streamlit doesn't share the launcher's process group, and
+    # no launcher descriptors (webview, sockets) leak into it.
+    return subprocess.Popen(cmd, env=env, close_fds=True, start_new_session=True,
                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
-def _do_setup(window, port: int, app_script: Path, config_file: Path) -> None:
+# Environment for pip subprocesses: no DYLD_* leakage, shared wheel cache,
+# no self-update check or prompts, and wheels preferred over sdists.
+_PIP_ENV = dict(
+    _CLEAN_ENV,
+    PIP_CACHE_DIR=str(_PIP_CACHE_DIR),
+    PIP_DISABLE_PIP_VERSION_CHECK="1",
+    PIP_NO_INPUT="1",
+    PIP_PREFER_BINARY="1",
+)
+
+
+def _start_prefetch(pip: str) -> dict[str, subprocess.Popen]:
+    """Start downloading PyPI and torch wheels concurrently; return the processes.
+
+    torch comes from a different index and dominates download time, so
+    fetching it alongside the PyPI set overlaps the two biggest latency
+    sources.  Each download gets its own directory under _WHEELS_DIR so an
+    install reading one never sees a half-written wheel from the other.
+    """
+    cmds = {
+        "pypi": ["-r", str(_REQUIREMENTS_FILE)],
+        "torch": ["--index-url", _TORCH_INDEX_URL,
+                  *(spec for _, spec in _TORCH_PACKAGES)],
+    }
+    procs = {}
+    for name, args in cmds.items():
+        dest = _WHEELS_DIR / name
+        dest.mkdir(parents=True, exist_ok=True)
+        procs[name] = subprocess.Popen(
+            [pip, "download", "--dest", str(dest), *args], env=_PIP_ENV,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+    return procs
+
+
+def _finish_prefetch(proc: subprocess.Popen) -> None:
+    """Wait for one download started by _start_prefetch.
+
+    Failures are non-fatal — the install phase falls back to the indexes for
+    anything missing.
+    """
+    _, err = proc.communicate()
+    if proc.returncode != 0:
+        log.warning("pip download failed (non-fatal):\n%s", err[-400:])
+
+
+def _js(fn: str, *args) -> str:
+    """Build a JS call with JSON-encoded arguments (safe for any string)."""
+    return f"{fn}({','.join(json.dumps(a) for a in args)})"
+
+
+class _SetupProgress:
+    """Coalesce setup-screen updates and push them to the webview at ≤10 Hz.
+
+    Every ``evaluate_js`` crosses the Python↔WebKit bridge synchronously, so
+    callers only enqueue.  A daemon thread drains the queue every
+    *interval* seconds, keeps the latest progress update, and sends the
+    batch as one script.  ``done``/``error`` calls are never dropped and keep
+    their order relative to progress.  Arguments are JSON-encoded, so labels
+    and error messages containing quotes are safe.
+    """
+
+    def __init__(self, window, interval: float = 0.1) -> None:
+        self._window = window
+        self._interval = interval
+        self._q: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def update(self, done: int, total: int, label: str) -> None:
+        self._q.put(("updateProgress", (done, total, label)))
+
+    def done(self) -> None:
+        self._q.put(("showDone", ()))
+
+    def error(self, msg: str) -> None:
+        self._q.put(("showError", (msg,)))
+
+    def close(self) -> None:
+        """Flush pending updates and stop the drain thread."""
+        self._q.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            items = [self._q.get()]
+            time.sleep(self._interval)
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    items.append(self._q.get_nowait())
+            calls: list[str] = []
+            pending = None
+            for item in items:
+                if item is None:
+                    stop = True
+                    continue
+                fn, args = item
+                if fn == "updateProgress":
+                    pending = item
+                    continue
+                if pending:
+                    calls.append(_js(pending[0], *pending[1]))
+                    pending = None
+                calls.append(_js(fn, *args))
+            if pending:
+                calls.append(_js(pending[0], *pending[1]))
+            if calls:
+                try:
+                    self._window.evaluate_js(";".join(calls))
+                except Exception as exc:  # noqa: BLE001  (a dropped repaint is harmless)
+                    log.debug("evaluate_js failed: %s", exc)
+
+
+# pip output lines worth surfacing on the setup screen while a batch runs.
+_PIP_PROGRESS_PREFIXES = ("Collecting ", "Downloading ", "Processing ",
+                          "Building wheel", "Installing collected packages")
+
+
+def _run_pip(ui: _SetupProgress, args: list[str], done: int, total: int) -> tuple[int, str]:
+    """Run pip, forwarding progress lines to the UI as they arrive.
+
+    Output is read line by line instead of being buffered whole, so the
+    setup screen shows what pip is doing and only a short tail is kept for
+    the log.  Returns (returncode, tail).
+    """
+    tail: collections.deque[str] = collections.deque(maxlen=20)
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1, env=_PIP_ENV)
+    for line in proc.stdout:
+        line = line.strip()
+        if not line:
+            continue
+        tail.append(line)
+        if line.startswith(_PIP_PROGRESS_PREFIXES):
+            ui.update(done, total, line[:80])
+    return proc.wait(), "\n".join(tail)
+
+
+def _install_batch(
+    ui: _SetupProgress, pip: str, pkgs: list[tuple[str, str]], opts: list[str],
+    done: int, total: int, req_file: Path | None = None,
+) -> None:
+    """Install a batch of packages with a single pip resolver run.
+
+    The batch is passed as a requirements file when *req_file* is given,
+    otherwise as specs on the command line.  If it fails (one bad requirement
+    aborts the whole resolve), retry the packages one at a time so a single
+    failure stays non-fatal.
+    """
+    labels = ", ".join(label for label, _ in pkgs)
+    ui.update(done, total, labels)
+    log.info("[%d/%d] Installing %s …", done + len(pkgs), total, labels)
+    reqs = ["-r", str(req_file)] if req_file else [spec for _, spec in pkgs]
+    rc, tail = _run_pip(ui, [pip, "install", *opts, *reqs], done, total)
+    if rc == 0:
+        return
+
+    log.warning("Batch install failed — retrying per package:\n%s", tail)
+    for i, (label, spec) in enumerate(pkgs):
+        ui.update(done + i, total, label)
+        rc, tail = _run_pip(ui, [pip, "install", *opts, spec], done + i, total)
+        if rc != 0:
+            log.warning("pip %s failed (non-fatal):\n%s", label, tail)
+
+
+def _do_setup(window, app_script: Path, config_file: Path) -> None:
     """Run in a background thread: install deps, then launch Streamlit."""
-    window.evaluate_js('updateProgress(0,0,"Preparing Python environment…")')
+    ui = _SetupProgress(window)
+    try:
+        ok = _install_deps(ui)
+    finally:
+        ui.close()
+    if not ok:
+        return
+    time.sleep(2)
+
+    _finish_launch(window, app_script, config_file)
+
+
+def _install_deps(ui: _SetupProgress) -> bool:
+    """Create the companion venv and install all packages; False on failure."""
+    ui.update(0, 0, "Preparing Python environment…")
     python = _find_python()
     if not python:
         msg = ("Python 3.10+ not found. "
                "Install it from python.org or via Homebrew: brew install python@3.12")
         log.error(msg)
-        window.evaluate_js(f'showError("{msg}")')
-        return
+        ui.error(msg)
+        return False
 
     log.info("Creating companion venv at %s using %s", _VENV, python)
-    window.evaluate_js('updateProgress(0,0,"Creating virtual environment…")')
+    ui.update(0, 0, "Creating virtual environment…")
     try:
         subprocess.run([python, "-m", "venv", str(_VENV)], check=True,
-                       capture_output=True)
+                       capture_output=True, env=_CLEAN_ENV)
     except subprocess.CalledProcessError as exc:
+        _PYTHON_CACHE_FILE.unlink(missing_ok=True)  # re-probe next time
         msg = f"Failed to create venv: {exc.stderr.decode()[:200]}"
         log.error(msg)
-        window.evaluate_js(f'showError("{msg}")')
-        return
+        ui.error(msg)
+        return False
 
     pip = str(_VENV / "bin" / "pip")
-    total = len(_PACKAGES)
-    for i, (label, args) in enumerate(_PACKAGES):
-        window.evaluate_js(f'updateProgress({i},{total},"{label}")')
-        log.info("[%d/%d] Installing %s …", i + 1, total, label)
-        result = subprocess.run([pip] + args, capture_output=True, text=True)
-        if result.returncode != 0:
-            log.warning("pip %s failed (non-fatal):\n%s", label,
-                        result.stderr[-400:])
+    _REQUIREMENTS_FILE.write_text(
+        "".join(f"{spec}\n" for _, spec in _PACKAGES), encoding="utf-8"
+    )
+    total = len(_BOOTSTRAP_PACKAGES) + len(_PACKAGES) + len(_TORCH_PACKAGES)
+    _install_batch(ui, pip, _BOOTSTRAP_PACKAGES, ["--upgrade"], 0, total)
+    done = len(_BOOTSTRAP_PACKAGES)
+
+    ui.update(done, total, "Downloading packages…")
+    log.info("Prefetching wheels into %s …", _WHEELS_DIR)
+    downloads = _start_prefetch(pip)
+
+    # The PyPI set installs as soon as its own download lands, while the
+    # torch download is still running.  The installs themselves stay serial:
+    # two pip processes writing one site-packages can clobber shared deps.
+    _finish_prefetch(downloads["pypi"])
+    pypi_links = ["--find-links", str(_WHEELS_DIR / "pypi")]
+    _install_batch(ui, pip, _PACKAGES, pypi_links, done, total, _REQUIREMENTS_FILE)
+    done += len(_PACKAGES)
+
+    _finish_prefetch(downloads["torch"])
+    _install_batch(ui, pip, _TORCH_PACKAGES,
+                   [*pypi_links, "--find-links", str(_WHEELS_DIR / "torch"),
+                    "--index-url", _TORCH_INDEX_URL], done, total)
+    shutil.rmtree(_WHEELS_DIR, ignore_errors=True)
 
     _SETUP_MARKER.touch()
     log.info("Setup complete — marker written")
-    window.evaluate_js('showDone()')
-    time.sleep(2)
-
-    _finish_launch(window, port, app_script, config_file)
+    ui.done()
+    return True
 
 
-def _finish_launch(window, port: int, app_script: Path, config_file: Path) -> None:
-    """Start Streamlit (with latest sources from GitHub) and navigate the window."""
+def _start_app(port: int, app_script: Path, config_file: Path) -> subprocess.Popen | None:
+    """Refresh sources from GitHub, then spawn Streamlit; return the process."""
     bundle_dir = app_script.parent
 
     # Pull latest sources from GitHub (3 s API timeout; falls back to cache).
@@ -572,15 +1163,29 @@ def _finish_launch(window, port: int, app_script: Path, config_file: Path) -> No
         pythonpath = str(bundle_dir)
         log.info("Using bundle sources (no live update available)")
 
-    proc = _launch_streamlit(port, live_app, config_file, pythonpath)
+    return _launch_streamlit(port, live_app, config_file, pythonpath)
+
+
+def _finish_launch(window, app_script: Path, config_file: Path) -> None:
+    """Start Streamlit (with latest sources from GitHub) and navigate the window.
+
+    The port is picked here, immediately before Streamlit binds it, rather
+    than at launcher start — first-time setup can run for minutes.
+    """
+    port = _find_free_port()
+    _show_app(window, port, _start_app(port, app_script, config_file))
+
+
+def _show_app(window, port: int, proc: subprocess.Popen | None) -> None:
+    """Wait for the Streamlit process to come up and navigate the window to it."""
     if proc is None:
-        window.evaluate_js('showError("Could not start Streamlit.")')
+        window.evaluate_js(_js("showError", "Could not start Streamlit."))
         return
 
     log.info("Waiting for Streamlit on port %d …", port)
     if not _wait_for_server(port):
         log.error("Streamlit did not respond within 120 s")
-        window.evaluate_js('showError("Streamlit failed to start — check launcher.log")')
+        window.evaluate_js(_js("showError", "Streamlit failed to start — check launcher.log"))
         proc.terminate()
         return
 
@@ -615,9 +1220,16 @@ def main() -> int:
         log.error("app.py not found at %s", app_script)
         return 1
 
-    port = _find_free_port()
     setup_needed = not _SETUP_MARKER.exists()
 
+    if not setup_needed:
+        # Warm launch: spawn Streamlit now so its cold start overlaps the
+        # webview import and Cocoa window creation instead of following them.
+        port = _find_free_port()
+        starter = ThreadPoolExecutor(max_workers=1)
+        app_future = starter.submit(_start_app, port, app_script, config_file)
+        starter.shutdown(wait=False)
+
     import webview  # noqa: PLC0415  (deferred — not bundled on next builds)
 
     if setup_needed:
@@ -629,7 +1241,7 @@ def main() -> int:
             resizable=True,
         )
         webview.start(
-            lambda: _do_setup(window, port, app_script, config_file),
+            lambda: _do_setup(window, app_script, config_file),
         )
     else:
         log.info("Setup already done — launching normally")
@@ -646,7 +1258,7 @@ def main() -> int:
             min_size=(960, 640),
         )
         webview.start(
-            lambda: _finish_launch(window, port, app_script, config_file),
+            lambda: _show_app(window, port, app_future.result()),
         )
 
     log.info("Webview closed — exiting")
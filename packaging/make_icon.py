@@ -12,17 +12,26 @@ Run:  python3 packaging/make_icon.py
 Output: packaging/icon.icns   (and packaging/icon.iconset/ for inspection)
 """
 
+import functools
+import importlib.util
 import math
 import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# ── Require Pillow ─────────────────────────────────────────────────────────────
+# ── Require Pillow (build-time dependency, installed by build_macos_dmg.sh) ──
+if importlib.util.find_spec("PIL") is None:
+    sys.exit("make_icon.py requires Pillow: python3 -m pip install Pillow")
+
+from PIL import Image, ImageDraw, ImageFilter
+
+# ── NumPy (optional — vectorised gradient; pure-Python fallback below) ───────
 try:
-    from PIL import Image, ImageDraw, ImageFilter
+    import numpy as np
 except ImportError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow", "-q"])
-    from PIL import Image, ImageDraw, ImageFilter
+    np = None
 
 # ── Palette ────────────────────────────────────────────────────────────────────
 BG_CENTER   = (18,  40,  80)   # deep navy (center of radial gradient)
@@ -38,26 +47,47 @@ BADGE_FG    = (255, 255, 255)  # badge glyph — white
 
 
 def _radial_gradient(size: int) -> Image.Image:
-    """Create a dark navy radial gradient background."""
-    img = Image.new("RGBA", (size, size))
+    """Create a dark navy radial gradient background (opaque RGB)."""
     cx = cy = size / 2
     max_r = size * 0.72  # gradient reaches edges
 
-    pixels = img.load()
+    if np is None:
+        return _radial_gradient_py(size, cx, cy, max_r)
+
+    ys, xs = np.mgrid[0:size, 0:size].astype(np.float64)
+    t = np.minimum(np.hypot(xs - cx, ys - cy) / max_r, 1.0)
+    t **= 1.6  # darken edges faster
+
+    arr = np.empty((size, size, 3), dtype=np.uint8)
+    for c in range(3):
+        arr[..., c] = np.round(BG_CENTER[c] * (1 - t) + BG_EDGE[c] * t)
+    return Image.fromarray(arr, "RGB")
+
+
+def _radial_gradient_py(size: int, cx: float, cy: float, max_r: float) -> Image.Image:
+    """Pure-Python gradient: one bytearray, hoisted locals, a single frombytes."""
+    bc0, bc1, bc2 = BG_CENTER
+    be0, be1, be2 = BG_EDGE
+    hypot = math.hypot
+    inv_max_r = 1.0 / max_r
+    buf = bytearray(size * size * 3)
+    off = 0
     for y in range(size):
+        dy = y - cy
         for x in range(size):
-            d = math.hypot(x - cx, y - cy)
-            t = min(d / max_r, 1.0)
-            t = t ** 1.6  # darken edges faster
-            r = round(BG_CENTER[0] * (1 - t) + BG_EDGE[0] * t)
-            g = round(BG_CENTER[1] * (1 - t) + BG_EDGE[1] * t)
-            b = round(BG_CENTER[2] * (1 - t) + BG_EDGE[2] * t)
-            pixels[x, y] = (r, g, b, 255)
-    return img
+            t = hypot(x - cx, dy) * inv_max_r
+            t = 1.0 if t > 1.0 else t ** 1.6
+            u = 1 - t
+            buf[off] = round(bc0 * u + be0 * t)
+            buf[off + 1] = round(bc1 * u + be1 * t)
+            buf[off + 2] = round(bc2 * u + be2 * t)
+            off += 3
+    return Image.frombytes("RGB", (size, size), bytes(buf))
 
 
+@functools.lru_cache(maxsize=8)
 def _rounded_rect_mask(size: int, radius: int) -> Image.Image:
-    """Alpha mask for a rounded-square icon."""
+    """Alpha mask for a rounded-square icon (cached — callers must not mutate it)."""
     mask = Image.new("L", (size, size), 0)
     d = ImageDraw.Draw(mask)
     d.rounded_rectangle([0, 0, size - 1, size - 1], radius=radius, fill=255)
@@ -102,7 +132,33 @@ def _draw_paper(draw: ImageDraw.ImageDraw, cx: float, cy: float,
         draw.line([(lx, ly), (rx_, ry)], fill=LINE_CLR + (255,), width=max(1, round(size * 0.004)))
 
 
-def _draw_graph(draw: ImageDraw.ImageDraw, cx: float, cy: float,
+@functools.cache
+def _node_sprite(r: float) -> tuple[Image.Image, Image.Image, int]:
+    """Pre-draw one node (glow ring, fill, highlight) as a sprite.
+
+    Returns the sprite, its paste mask and the offset of the node centre
+    within it, so each node is a single paste instead of three ellipse
+    rasterisations.  Inks replace pixels rather than blend (as when drawn
+    straight onto the icon), so the mask is simply "anything drawn".
+    """
+    glow_r = r * 1.45
+    c = math.ceil(glow_r)
+    sprite = Image.new("RGBA", (2 * c + 1, 2 * c + 1), (0, 0, 0, 0))
+    d = ImageDraw.Draw(sprite)
+    # Outer glow ring
+    d.ellipse([(c - glow_r, c - glow_r), (c + glow_r, c + glow_r)],
+              fill=NODE_CLR + (50,))
+    # Node fill
+    d.ellipse([(c - r, c - r), (c + r, c + r)], fill=NODE_CLR + (255,))
+    # White inner highlight
+    hr = r * 0.38
+    d.ellipse([(c - hr, c - hr + r * 0.06), (c + hr, c - hr * 0.4 + r * 0.06)],
+              fill=(255, 255, 255, 160))
+    mask = sprite.getchannel("A").point(lambda a: 255 if a else 0)
+    return sprite.convert("RGB"), mask, c
+
+
+def _draw_graph(img: Image.Image, draw: ImageDraw.ImageDraw, cx: float, cy: float,
                 size: int) -> None:
     """Draw an amber knowledge-graph overlay (nodes + edges)."""
     s = size
@@ -130,24 +186,8 @@ def _draw_graph(draw: ImageDraw.ImageDraw, cx: float, cy: float,
 
     # Draw nodes
     for i, (nx, ny) in enumerate(nodes):
-        r = nr[i]
-        # Outer glow ring
-        glow_r = r * 1.45
-        draw.ellipse(
-            [(nx - glow_r, ny - glow_r), (nx + glow_r, ny + glow_r)],
-            fill=NODE_CLR + (50,),
-        )
-        # Node fill
-        draw.ellipse(
-            [(nx - r, ny - r), (nx + r, ny + r)],
-            fill=NODE_CLR + (255,),
-        )
-        # White inner highlight
-        hr = r * 0.38
-        draw.ellipse(
-            [(nx - hr, ny - hr + r * 0.06), (nx + hr, ny - hr * 0.4 + r * 0.06)],
-            fill=(255, 255, 255, 160),
-        )
+        sprite, mask, c = _node_sprite(nr[i])
+        img.paste(sprite, (round(nx - c), round(ny - c)), mask)
 
 
 def _draw_badge(draw: ImageDraw.ImageDraw, size: int) -> None:
@@ -198,8 +238,11 @@ def render_icon(size: int) -> Image.Image:
     """Render the icon at `size` × `size` pixels (RGBA)."""
 
     # ── Background ──────────────────────────────────────────────────────────
+    # Drawn as opaque RGB — inks overwrite pixels exactly as they did on the
+    # old RGBA canvas, whose alpha plane putalpha() replaced anyway — so the
+    # only alpha work is attaching the corner mask once at the end.
     img = _radial_gradient(size)
-    draw = ImageDraw.Draw(img, "RGBA")
+    draw = ImageDraw.Draw(img)
 
     # ── Paper card ──────────────────────────────────────────────────────────
     paper_w = size * 0.56
@@ -208,7 +251,7 @@ def render_icon(size: int) -> Image.Image:
     _draw_paper(draw, size * 0.45, size * 0.44, paper_w, paper_h, angle_deg=-7, size=size)
 
     # ── Knowledge graph ──────────────────────────────────────────────────────
-    _draw_graph(draw, size * 0.50, size * 0.50, size)
+    _draw_graph(img, draw, size * 0.50, size * 0.50, size)
 
     # ── Review badge ─────────────────────────────────────────────────────────
     _draw_badge(draw, size)
@@ -231,20 +274,42 @@ def build_icns(out_dir: str = "packaging") -> str:
     icns_path   = os.path.join(out_dir, "icon.icns")
     os.makedirs(iconset_dir, exist_ok=True)
 
+    # Render the largest tile once and Lanczos-downsample the rest — the
+    # design is proportional (corner radius, strokes, nodes all scale with
+    # size), so the small tiles match what iconutil would produce anyway.
     print("Rendering icon sizes…")
-    for s in ICONSET_SIZES:
-        img = render_icon(s)
+    master_size = max(ICONSET_SIZES)
+    master = render_icon(master_size)
+    images = {
+        s: master if s == master_size else master.resize((s, s), Image.LANCZOS)
+        for s in ICONSET_SIZES
+    }
+
+    # PNG encoding (zlib) releases the GIL, so the sizes encode in parallel.
+    def _save(s: int) -> str:
+        path = os.path.join(iconset_dir, f"icon_{s}x{s}.png")
+        images[s].save(path, format="PNG")
+        return path
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        paths = dict(zip(ICONSET_SIZES, pool.map(_save, ICONSET_SIZES)))
 
+    for s in ICONSET_SIZES:
         # 1× name
-        name_1x = f"icon_{s}x{s}.png"
-        img.save(os.path.join(iconset_dir, name_1x), format="PNG")
-        print(f"  {name_1x}")
+        print(f"  icon_{s}x{s}.png")
 
-        # 2× name (half the logical size, same pixel count = @2x)
+        # 2× name (half the logical size, same pixel count = @2x) — identical
+        # bytes, so link to the PNG already written instead of encoding again.
         if s >= 32:
             half = s // 2
             name_2x = f"icon_{half}x{half}@2x.png"
-            img.save(os.path.join(iconset_dir, name_2x), format="PNG")
+            path_2x = os.path.join(iconset_dir, name_2x)
+            if os.path.lexists(path_2x):
+                os.remove(path_2x)
+            try:
+                os.link(paths[s], path_2x)
+            except OSError:
+                shutil.copyfile(paths[s], path_2x)
             print(f"  {name_2x}")
 
     # iconutil (macOS built-in) converts iconset → .icns
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import http.client
 import logging
 import os
 import signal
@@ -9,7 +10,6 @@ import socket
 import sys
 import threading
 import time
-import urllib.request
 from pathlib import Path
 
 # ── Log to user home (no console in windowed .exe) ───────────────────────────
@@ -29,37 +29,77 @@ def resource_path(relative: str) -> Path:
     return base / relative
 
 
-def _find_free_port(start: int = 8502, end: int = 8600) -> int:
-    for port in range(start, end):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            try:
-                s.bind(("localhost", port))
-                return port
-            except OSError:
-                continue
-    return start
+def _find_free_port() -> int:
+    """Return a free localhost port chosen by the kernel (bind to port 0).
+
+    On Windows SO_REUSEADDR lets a socket bind a port another process is
+    already using, so the probe asks for exclusive use instead.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        exclusive = getattr(socket, "SO_EXCLUSIVEADDRUSE", None)
+        if exclusive is not None:
+            s.setsockopt(socket.SOL_SOCKET, exclusive, 1)
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
 
 
-def _start_streamlit(app_script: Path, port: int) -> None:
-    """Run the Streamlit server in headless mode.
+def _install_ready_hook(ready: threading.Event, port: int) -> None:
+    """Arrange for *ready* to be set as soon as the Streamlit server is up.
 
-    Patches signal.signal so the ValueError raised outside the main thread
-    does not crash the Streamlit startup sequence.
+    Wraps ``streamlit.web.bootstrap._on_server_start`` (called once the
+    Tornado server is listening) so the main thread can block on the event
+    instead of polling the health endpoint.  If the hook is missing in the
+    installed Streamlit version, fall back to polling in a helper thread.
     """
-    _orig_signal = signal.signal
+    try:
+        from streamlit.web import bootstrap
+
+        _orig_on_server_start = bootstrap._on_server_start
+    except (ImportError, AttributeError):
+        log.warning("Streamlit startup hook unavailable — polling health endpoint")
+
+        def _poll() -> None:
+            if _wait_for_server(port):
+                ready.set()
 
-    def _thread_safe_signal(signum, handler):
+        threading.Thread(target=_poll, daemon=True).start()
+        return
+
+    def _on_server_start(server) -> None:
         try:
-            return _orig_signal(signum, handler)
-        except (ValueError, OSError):
-            pass
+            _orig_on_server_start(server)
+        finally:
+            ready.set()
+
+    bootstrap._on_server_start = _on_server_start
+
 
-    signal.signal = _thread_safe_signal  # type: ignore[assignment]
+# Streamlit installs signal handlers during startup, but here it runs on a
+# worker thread where signal.signal() raises ValueError.  Patch once, for
+# the whole process: the main thread (pywebview) keeps the real behaviour,
+# other threads get a silent no-op.
+_orig_signal = signal.signal
 
+
+def _thread_safe_signal(signum, handler):
+    if threading.current_thread() is threading.main_thread():
+        return _orig_signal(signum, handler)
+    try:
+        return _orig_signal(signum, handler)
+    except (ValueError, OSError):
+        return None
+
+
+signal.signal = _thread_safe_signal  # type: ignore[assignment]
+
+
+def _start_streamlit(app_script: Path, port: int, ready: threading.Event) -> None:
+    """Run the Streamlit server in headless mode (on a worker thread)."""
     try:
         from streamlit.web import cli as stcli
 
+        _install_ready_hook(ready, port)
+
         sys.argv = [
             "streamlit", "run", str(app_script),
             "--server.headless", "true",
@@ -68,28 +108,42 @@ def _start_streamlit(app_script: Path, port: int) -> None:
             "--global.developmentMode", "false",
             "--browser.gatherUsageStats", "false",
             "--server.fileWatcherType", "none",
+            "--runner.magicEnabled", "false",
         ]
         log.info("Starting Streamlit on port %d …", port)
         stcli.main()
     except Exception:
         log.exception("Streamlit thread crashed")
-    finally:
-        signal.signal = _orig_signal  # type: ignore[assignment]
 
 
 def _wait_for_server(port: int, timeout: int = 120) -> bool:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        try:
-            with urllib.request.urlopen(
-                f"http://localhost:{port}/_stcore/health", timeout=1
-            ) as resp:
-                if resp.status == 200:
-                    return True
-        except Exception:
-            pass
-        time.sleep(0.3)
-    return False
+    """Poll the health endpoint over one reused keep-alive connection.
+
+    While nothing is listening (the frozen app can take tens of seconds to
+    unpack and import Streamlit) the delay doubles from 100 ms up to 2 s.
+    Once the server answers but is not yet healthy, it is retried every
+    100 ms — readiness is then imminent.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    conn = http.client.HTTPConnection("localhost", port, timeout=1)
+    try:
+        while time.monotonic() < deadline:
+            try:
+                conn.request("GET", "/_stcore/health")
+                resp = conn.getresponse()
+                resp.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()  # reconnects on the next request
+                time.sleep(delay)
+                delay = min(delay * 2, 2.0)
+                continue
+            if resp.status == 200:
+                return True
+            time.sleep(0.1)
+        return False
+    finally:
+        conn.close()
 
 
 def main() -> int:
@@ -117,13 +171,14 @@ def main() -> int:
     port = _find_free_port()
     log.info("Using port %d", port)
 
+    ready = threading.Event()
     t = threading.Thread(
-        target=_start_streamlit, args=(app_script, port), daemon=True
+        target=_start_streamlit, args=(app_script, port, ready), daemon=True
     )
     t.start()
 
     log.info("Waiting for Streamlit to become healthy …")
-    if not _wait_for_server(port):
+    if not ready.wait(timeout=120):
         log.error("Streamlit server did not start within 120 s")
         return 1
 
@@ -1,6 +1,5 @@
 """Research Analyser - AI-powered research paper analysis tool."""
 
-from research_analyser.analyser import ResearchAnalyser
 from research_analyser.models import (
     AnalysisOptions,
     AnalysisReport,
@@ -18,3 +17,14 @@ __all__ = [
     "PaperInput",
     "PeerReview",
 ]
+
+
+def __getattr__(name):
+    # ResearchAnalyser pulls in every subsystem (aiohttp, pydantic settings,
+    # OCR / diagram / review modules); import it on first use so that
+    # `python -m research_analyser --help` and the models don't pay for it.
+    if name == "ResearchAnalyser":
+        from research_analyser.analyser import ResearchAnalyser
+
+        return ResearchAnalyser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,21 +7,35 @@ from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table as RichTable
 
-from research_analyser.analyser import ResearchAnalyser
-from research_analyser.comparison import (
-    build_comparison_markdown,
-    parse_external_review,
-    parse_local_review,
-)
 from research_analyser.config import Config
 from research_analyser.models import AnalysisOptions
-from research_analyser.reviewer import interpret_score
+
+# Subsystem modules (analyser, comparison, reviewer) are imported inside the
+# commands that use them, so `--help` and argument errors stay fast.
+
+# libuv-based event loop for the CLI's asyncio.run calls, when installed
+if sys.platform == "win32":
+    try:
+        import winloop as _fast_loop
+    except ImportError:
+        _fast_loop = None
+else:
+    try:
+        import uvloop as _fast_loop
+    except ImportError:
+        _fast_loop = None
 
 console = Console()
 
 
+def _run(coro):
+    """Run *coro* to completion on uvloop / winloop if available."""
+    if _fast_loop is not None:
+        return _fast_loop.run(coro)
+    return asyncio.run(coro)
+
+
 def setup_logging(level: str = "INFO"):
     logging.basicConfig(
         level=getattr(logging, level.upper()),
@@ -58,6 +72,11 @@ def cli(ctx, config, verbose):
 @click.pass_context
 def analyse(ctx, source, output, diagrams, review, venue, diagram_type, audio):
     """Analyse a research paper (PDF file, URL, arXiv ID, or DOI)."""
+    from rich.table import Table as RichTable
+
+    from research_analyser.analyser import ResearchAnalyser
+    from research_analyser.reviewer import interpret_score
+
     config = ctx.obj["config"]
     if output:
         config.app.output_dir = output
@@ -72,7 +91,7 @@ def analyse(ctx, source, output, diagrams, review, venue, diagram_type, audio):
     analyser = ResearchAnalyser(config=config)
 
     with console.status("[bold green]Analysing paper..."):
-        report = asyncio.run(
+        report = _run(
             analyser.analyse(source, options=options)
         )
 
@@ -121,6 +140,8 @@ def analyse(ctx, source, output, diagrams, review, venue, diagram_type, audio):
 @click.pass_context
 def diagrams(ctx, source, output, diagram_types):
     """Generate diagrams only from a paper."""
+    from research_analyser.analyser import ResearchAnalyser
+
     config = ctx.obj["config"]
     if output:
         config.app.output_dir = output
@@ -134,7 +155,7 @@ def diagrams(ctx, source, output, diagram_types):
     analyser = ResearchAnalyser(config=config)
 
     with console.status("[bold green]Generating diagrams..."):
-        report = asyncio.run(analyser.analyse(source, options=options))
+        report = _run(analyser.analyse(source, options=options))
 
     console.print(f"[bold green]Generated {len(report.diagrams)} diagram(s)[/bold green]")
     for d in report.diagrams:
@@ -148,6 +169,9 @@ def diagrams(ctx, source, output, diagram_types):
 @click.pass_context
 def review(ctx, source, venue, output):
     """Generate peer review only for a paper."""
+    from research_analyser.analyser import ResearchAnalyser
+    from research_analyser.reviewer import interpret_score
+
     config = ctx.obj["config"]
     if output:
         config.app.output_dir = output
@@ -160,7 +184,7 @@ def review(ctx, source, venue, output):
     analyser = ResearchAnalyser(config=config)
 
     with console.status("[bold green]Generating review..."):
-        report = asyncio.run(analyser.analyse(source, options=options))
+        report = _run(analyser.analyse(source, options=options))
 
     if report.review:
         score = report.review.overall_score
@@ -188,6 +212,13 @@ def review(ctx, source, venue, output):
 )
 def compare_reviews(external_review_file, our_output, save):
     """Compare local review results with an external review file."""
+    from research_analyser.comparison import (
+        build_comparison_markdown,
+        parse_external_review,
+        parse_local_review,
+    )
+    from research_analyser.reviewer import interpret_score
+
     external_path = Path(external_review_file)
     if not external_path.exists():
         console.print(f"[red]External review file not found:[/red] {external_review_file}")
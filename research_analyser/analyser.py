@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
+import tempfile
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from research_analyser.config import Config
 from research_analyser.diagram_generator import DiagramGenerator
@@ -17,6 +24,7 @@ from research_analyser.models import (
     KeyPoint,
     PaperInput,
     PaperSummary,
+    PeerReview,
     ReportMetadata,
     SourceType,
 )
@@ -28,6 +36,79 @@ from research_analyser.tts_engine import TTSEngine
 
 logger = logging.getLogger(__name__)
 
+_SOURCE_TYPES = {member.value: member for member in SourceType}
+
+# OCR model loads left running after a failed download (see analyse()).
+_detached_warmups: set[asyncio.Task] = set()
+
+
+def _on_warmup_done(task: asyncio.Task) -> None:
+    _detached_warmups.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Detached OCR warmup failed: %s", task.exception())
+
+
+# Report writes still running for analyses that didn't wait on disk; holding
+# the tasks here keeps them from being garbage-collected mid-write.
+_pending_saves: set[asyncio.Task] = set()
+
+
+def _on_save_done(task: asyncio.Task) -> None:
+    _pending_saves.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Saving report files failed: %s", task.exception())
+
+
+# Bump to invalidate cached reviews / STORM articles after a format change
+CACHE_SCHEMA_VERSION = 1
+
+# Section-title / body keywords used to pick the summary sections.
+_METHOD_TITLE_KWS = (
+    "method", "approach", "proposed", "framework", "technique",
+    "model", "algorithm", "system", "design", "pipeline",
+    "architecture", "contribution", "formulation", "solution",
+    "overview", "our ",
+)
+_METHOD_CONTENT_KWS = (
+    "we propose", "we present", "our method", "our approach",
+    "the proposed", "algorithm", "architecture", "pipeline",
+    "formulation", "framework",
+)
+_RESULTS_TITLE_KWS = (
+    "result", "experiment", "evaluation", "performance",
+    "benchmark", "comparison", "analysis", "ablation",
+    "finding", "quantitative", "accuracy", "discussion",
+)
+# "conclu" also catches "Concluding Remarks" / "Conclusions and Future Work"
+_CONCLUSION_TITLE_KWS = ("conclu", "final remarks", "closing remarks")
+_RESULTS_CONTENT_KWS = (
+    "table", "accuracy", "f1", "precision", "recall",
+    "outperforms", "baseline", "state-of-the-art", "sota",
+    "improvement", "score", "metric", "% ",
+)
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """One case-insensitive alternation, so a section body is scanned once in C
+    instead of lower-cased and searched once per keyword."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+_METHOD_CONTENT_RE = _keyword_pattern(_METHOD_CONTENT_KWS)
+_RESULTS_CONTENT_RE = _keyword_pattern(_RESULTS_CONTENT_KWS)
+
+
+def _first_distinct(sections, distinct, pattern: re.Pattern | None = None) -> str:
+    """First section (matching *pattern*, if given) whose 500-char head passes
+    *distinct*; returns that head, or "".  Slices only the candidates."""
+    for section in sections:
+        if pattern is not None and not pattern.search(section.content):
+            continue
+        text = section.content[:500].strip()
+        if distinct(text):
+            return text
+    return ""
+
 
 class ResearchAnalyser:
     """Main orchestrator for the research paper analysis pipeline.
@@ -45,12 +126,33 @@ class ResearchAnalyser:
 
         self.input_handler = InputHandler(
             temp_dir=self.config.app.temp_dir,
+            connect_timeout=self.config.app.connect_timeout,
+            read_timeout=self.config.app.read_timeout,
+            retry_attempts=self.config.app.retry_attempts,
+            download_ttl=self.config.app.download_cache_ttl,
         )
-        self.ocr_engine = OCREngine(
+        self._beautiful_mermaid_dir = Path(__file__).resolve().parent.parent / "packaging" / "beautiful_mermaid"
+        self.report_generator = ReportGenerator()
+
+    # Heavier subsystems are built on first access, so a run that skips
+    # diagrams, review, STORM or audio never pays for them (TTSEngine and, off
+    # Apple Silicon, OCREngine import torch just to pick a device).
+
+    @functools.cached_property
+    def ocr_engine(self) -> OCREngine:
+        return OCREngine(
             model_name=self.config.ocr.model,
             device=self.config.ocr.device,
+            cache_dir=(
+                Path(self.config.app.output_dir) / ".cache" / "ocr"
+                if self.config.ocr.cache_enabled
+                else None
+            ),
         )
-        self.diagram_generator = DiagramGenerator(
+
+    @functools.cached_property
+    def diagram_generator(self) -> DiagramGenerator:
+        return DiagramGenerator(
             provider=self.config.diagrams.provider,
             vlm_model=self.config.diagrams.vlm_model,
             image_model=self.config.diagrams.image_model,
@@ -61,15 +163,19 @@ class ResearchAnalyser:
             output_dir=str(Path(self.config.app.output_dir) / "diagrams"),
             skip_ssl_verification=self.config.diagrams.skip_ssl_verification,
         )
-        self._beautiful_mermaid_dir = Path(__file__).resolve().parent.parent / "packaging" / "beautiful_mermaid"
-        self.reviewer = PaperReviewer(
+
+    @functools.cached_property
+    def reviewer(self) -> PaperReviewer:
+        return PaperReviewer(
             llm_provider=self.config.review.llm_provider,
             model=self.config.review.model,
             tavily_api_key=self.config.tavily_api_key,
             openai_api_key=self.config.openai_api_key,
         )
-        self.report_generator = ReportGenerator()
-        self.storm_reporter = STORMReporter(
+
+    @functools.cached_property
+    def storm_reporter(self) -> STORMReporter:
+        return STORMReporter(
             openai_api_key=self.config.openai_api_key,
             conv_model=self.config.storm.conv_model,
             outline_model=self.config.storm.outline_model,
@@ -79,7 +185,10 @@ class ResearchAnalyser:
             search_top_k=self.config.storm.search_top_k,
             retrieve_top_k=self.config.storm.retrieve_top_k,
         )
-        self.tts_engine = TTSEngine(
+
+    @functools.cached_property
+    def tts_engine(self) -> TTSEngine:
+        return TTSEngine(
             model_name=self.config.tts.model,
             device=self.config.tts.device,
             speaker=self.config.tts.speaker,
@@ -102,8 +211,9 @@ class ResearchAnalyser:
         Returns:
             Complete AnalysisReport with all analysis results
         """
-        start_time = time.time()
-        options = options or AnalysisOptions()
+        start_time = time.monotonic()
+        if options is None:
+            options = AnalysisOptions()
 
         def _progress(message: str) -> None:
             if on_progress is not None:
@@ -114,7 +224,8 @@ class ResearchAnalyser:
 
         # 1. Detect source type
         if source_type:
-            detected_type = SourceType(source_type)
+            # Unknown strings fall through to SourceType() for its ValueError
+            detected_type = _SOURCE_TYPES.get(source_type) or SourceType(source_type)
         else:
             detected_type = self.input_handler.detect_source_type(source)
 
@@ -124,24 +235,33 @@ class ResearchAnalyser:
             analysis_options=options,
         )
 
-        logger.info(f"Analysing paper: {source} (type: {detected_type.value})")
+        logger.info("Analysing paper: %s (type: %s)", source, detected_type.value)
 
-        # 2. Resolve to local PDF — forward SSL/network warnings to progress stream
+        # 2. Resolve to local PDF — forward SSL/network warnings to progress stream.
+        #    The OCR model loads in the background meanwhile.
         _progress("⬇️  Fetching PDF…")
+        ocr_warmup = asyncio.create_task(self.ocr_engine.warmup())
         self.input_handler._on_warning = _progress
         try:
             pdf_path = await self.input_handler.resolve(paper_input)
+        except BaseException:
+            # Report the failure now rather than after the model load; the
+            # load carries on in the background and the next analysis uses it.
+            _detached_warmups.add(ocr_warmup)
+            ocr_warmup.add_done_callback(_on_warmup_done)
+            raise
         finally:
             self.input_handler._on_warning = None
-        logger.info(f"Resolved to: {pdf_path}")
+        await ocr_warmup
+        logger.info("Resolved to: %s", pdf_path)
         _progress(f"✓  PDF ready — {pdf_path.name}")
 
         # 3. Extract content via MonkeyOCR
         _progress("🔍  Extracting content (OCR)…")
         content = await self.ocr_engine.extract(pdf_path)
         logger.info(
-            f"Extracted: {len(content.equations)} equations, "
-            f"{len(content.tables)} tables, {len(content.figures)} figures"
+            "Extracted: %d equations, %d tables, %d figures",
+            len(content.equations), len(content.tables), len(content.figures),
         )
         _progress(
             f"✓  Extracted {len(content.sections)} sections · "
@@ -161,14 +281,12 @@ class ResearchAnalyser:
         _paper_id = _epid(source)
         _paper_output_dir = Path(self.config.app.output_dir) / _paper_id
 
-        tasks = []
+        tasks = {}  # label -> coroutine
         if options.generate_diagrams:
             engine = options.diagram_engine
             if engine == "beautiful_mermaid":
-                tasks.append(
-                    self._generate_beautiful_mermaid_diagrams(
-                        content, options.diagram_types, _paper_output_dir
-                    )
+                tasks["diagrams"] = self._generate_beautiful_mermaid_diagrams(
+                    content, options.diagram_types, _paper_output_dir
                 )
             else:
                 # PaperBanana
@@ -180,8 +298,8 @@ class ResearchAnalyser:
                 else:
                     # Point diagram output to paper-ID folder
                     self.diagram_generator.output_dir = _paper_output_dir / "diagrams"
-                    tasks.append(
-                        self.diagram_generator.generate(content, options.diagram_types)
+                    tasks["diagrams"] = self.diagram_generator.generate(
+                        content, options.diagram_types
                     )
         if options.generate_review:
             if not self.config.openai_api_key:
@@ -190,36 +308,65 @@ class ResearchAnalyser:
                     "Set it in .env or VS Code extension settings."
                 )
             else:
-                tasks.append(
-                    self.reviewer.review(content, paper_input.target_venue)
+                tasks["peer review"] = self._cached_review(
+                    content, paper_input.target_venue
                 )
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
+        # Consume results as each task finishes so progress (and the SSE
+        # stream behind on_progress) reports the faster one without waiting
+        # for the slowest.
+        running = {asyncio.ensure_future(coro): label for label, coro in tasks.items()}
+        pending = set(running)
         diagrams = []
         review = None
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Analysis task failed: {result}")
-            elif isinstance(result, list):
-                diagrams = result
-            else:
-                review = result
+        # Summaries depend only on the extracted content, so they are built
+        # in a worker thread while the diagram / review calls run.  Created
+        # right before the try so its except can always cancel it.
+        abstract_500 = content.abstract[:500] if content.abstract else ""
+        summaries = asyncio.create_task(
+            asyncio.to_thread(self._extract_summaries, content, abstract_500)
+        )
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    label = running[task]
+                    exc = task.exception()
+                    if exc is not None:
+                        logger.error("Analysis task failed: %s", exc)
+                        _progress(f"⚠️  {label.capitalize()} failed")
+                    elif label == "diagrams":
+                        diagrams = task.result()
+                        _progress(f"✓  Diagrams ready ({len(diagrams)})")
+                    else:
+                        review = task.result()
+                        if review is not None:
+                            _progress(f"✓  Peer review — {review.overall_score:.1f} / 10")
+        except BaseException:
+            summaries.cancel()
+            raise
+        finally:
+            # Like gather(): if analyse() itself is cancelled, so are its subtasks
+            for task in pending:
+                task.cancel()
 
         # 5. Generate summary
+        methodology, results_summary, conclusions = await summaries
         summary = PaperSummary(
             one_sentence=f"Analysis of '{content.title}'",
-            abstract_summary=content.abstract[:500] if content.abstract else "",
-            methodology_summary=self._extract_methodology_summary(content),
-            results_summary=self._extract_results_summary(content),
-            conclusions=self._extract_conclusions(content),
+            abstract_summary=abstract_500,
+            methodology_summary=methodology,
+            results_summary=results_summary,
+            conclusions=conclusions,
         )
 
         # 6. Extract key points
-        key_points = self._extract_key_points(content, review)
+        key_points = await asyncio.to_thread(self._extract_key_points, content, review)
 
         # 7. Assemble report
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         metadata = ReportMetadata(
             ocr_model=self.config.ocr.model,
             diagram_provider=self.config.diagrams.provider,
@@ -241,40 +388,156 @@ class ResearchAnalyser:
         from research_analyser.input_handler import extract_paper_id
         paper_id = extract_paper_id(source)
         output_dir = Path(self.config.app.output_dir) / paper_id
-        self.report_generator.save_all(report, output_dir)
-
-        # 9. Generate STORM Wikipedia-style report (if requested)
-        if options.generate_storm_report and self.config.storm.enabled:
+        # Written in a worker thread, overlapping STORM / TTS.  A shallow copy
+        # so the STORM step can set storm_report without racing the writer.
+        save_task = asyncio.create_task(
+            self.report_generator.asave_all(dataclasses.replace(report), output_dir)
+        )
+        _pending_saves.add(save_task)
+        save_task.add_done_callback(_on_save_done)
+
+        # 9 + 10. STORM report and audio narration both only read the finished
+        # report, so they run concurrently, each under its own deadline.  (A
+        # timed-out worker thread is abandoned, not killed; analyse() returns.)
+        async def _storm() -> None:
+            cfg = self.config.storm
             try:
                 _progress("🌪️  Generating STORM Wikipedia report…")
                 logger.info("Generating STORM report...")
-                # STORMWikiRunner.run() makes blocking DSPy/litellm calls;
-                # run in a thread to keep the event loop free (Principle II).
-                report.storm_report = await asyncio.to_thread(
-                    self.storm_reporter.generate, report
+                report.storm_report = await asyncio.wait_for(
+                    self._cached_storm_report(report), cfg.timeout_seconds
                 )
                 if report.storm_report:
+                    output_dir.mkdir(parents=True, exist_ok=True)
                     storm_path = output_dir / "storm_report.md"
                     storm_path.write_text(report.storm_report, encoding="utf-8")
-                    logger.info(f"STORM report saved to {storm_path}")
+                    logger.info("STORM report saved to %s", storm_path)
+            except asyncio.TimeoutError:
+                logger.error("STORM report generation timed out after %ss", cfg.timeout_seconds)
             except Exception as exc:
-                logger.error(f"STORM report generation failed: {exc}")
+                logger.error("STORM report generation failed: %s", exc)
 
-        # 10. Generate audio narration (if requested)
-        audio_path = None
-        if options.generate_audio:
+        async def _audio() -> None:
+            cfg = self.config.tts
             try:
                 _progress("🎙️  Generating audio narration (TTS)…")
                 logger.info("Generating audio narration with Qwen3-TTS...")
-                audio_path = await self.tts_engine.synthesize(report, output_dir)
-                logger.info(f"Audio saved to: {audio_path}")
+                audio_path = await asyncio.wait_for(
+                    self.tts_engine.synthesize(report, output_dir), cfg.timeout_seconds
+                )
+                logger.info("Audio saved to: %s", audio_path)
+            except asyncio.TimeoutError:
+                logger.error("Audio generation timed out after %ss", cfg.timeout_seconds)
             except Exception as exc:
-                logger.error(f"Audio generation failed: {exc}")
+                logger.error("Audio generation failed: %s", exc)
+
+        post_steps = []
+        if options.generate_storm_report and self.config.storm.enabled:
+            post_steps.append(_storm())
+        if options.generate_audio:
+            post_steps.append(_audio())
+        if post_steps:
+            await asyncio.gather(*post_steps)
+
+        if options.wait_for_disk:
+            await save_task
 
-        logger.info(f"Analysis complete in {elapsed:.1f}s. Output: {output_dir}")
+        logger.info("Analysis complete in %.1fs. Output: %s", elapsed, output_dir)
 
         return report
 
+    @staticmethod
+    async def wait_for_pending_saves() -> None:
+        """Wait for report files still being written by earlier analyses.
+
+        Only analyses run with ``wait_for_disk=False`` leave writes behind;
+        long-running servers should call this before shutting down.
+        """
+        if _pending_saves:
+            await asyncio.gather(*_pending_saves, return_exceptions=True)
+
+    # ── LLM-stage result cache ────────────────────────────────────────────
+    # Review and STORM output is keyed on the extracted paper text plus every
+    # setting that changes the prompt or model, so an identical re-run skips
+    # the LLM calls.  Entries are JSON files under output_dir/.cache/<kind>.
+
+    def _llm_cache_path(self, kind: str, *parts: str) -> Path:
+        h = hashlib.sha256(f"v{CACHE_SCHEMA_VERSION}".encode())
+        for part in parts:
+            h.update(b"\0")
+            h.update(part.encode("utf-8", "surrogatepass"))
+        return Path(self.config.app.output_dir) / ".cache" / kind / f"{h.hexdigest()}.json"
+
+    @staticmethod
+    def _read_llm_cache(path: Path) -> Any | None:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, exc)
+            return None
+
+    @staticmethod
+    def _write_llm_cache(path: Path, value: Any) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as exc:
+            logger.warning("Could not write cache entry %s: %s", path, exc)
+
+    async def _cached_review(self, content, target_venue: str | None) -> PeerReview:
+        cfg = self.config.review
+        if not cfg.cache_enabled:
+            return await self.reviewer.review(content, target_venue)
+
+        path = self._llm_cache_path(
+            "review", content.full_text, target_venue or "",
+            cfg.llm_provider, cfg.model, str(cfg.use_tavily),
+        )
+        cached = await asyncio.to_thread(self._read_llm_cache, path)
+        if cached is not None:
+            try:
+                review = PeerReview.from_dict(cached)
+            except (KeyError, TypeError) as exc:
+                logger.warning("Ignoring stale review cache %s: %s", path, exc)
+            else:
+                logger.info("Using cached peer review (%s)", path.name)
+                return review
+
+        review = await self.reviewer.review(content, target_venue)
+        await asyncio.to_thread(self._write_llm_cache, path, dataclasses.asdict(review))
+        return review
+
+    async def _cached_storm_report(self, report: AnalysisReport) -> str:
+        # STORMWikiRunner.run() makes blocking DSPy/litellm calls;
+        # run in a thread to keep the event loop free (Principle II).
+        cfg = self.config.storm
+        if not cfg.cache_enabled:
+            return await asyncio.to_thread(self.storm_reporter.generate, report)
+
+        path = self._llm_cache_path(
+            "storm", report.extracted_content.full_text,
+            cfg.conv_model, cfg.outline_model, cfg.article_model,
+            f"{cfg.max_conv_turn}/{cfg.max_perspective}/{cfg.search_top_k}/{cfg.retrieve_top_k}",
+        )
+        cached = await asyncio.to_thread(self._read_llm_cache, path)
+        if isinstance(cached, str) and cached:
+            logger.info("Using cached STORM report (%s)", path.name)
+            return cached
+
+        article = await asyncio.to_thread(self.storm_reporter.generate, report)
+        if article:
+            await asyncio.to_thread(self._write_llm_cache, path, article)
+        return article
+
     async def _generate_beautiful_mermaid_diagrams(
         self,
         content,
@@ -286,7 +549,6 @@ class ResearchAnalyser:
         Produces Mermaid code from paper content, renders it to SVG using
         the beautiful-mermaid package, then converts to PNG.
         """
-        import subprocess
         from research_analyser.models import GeneratedDiagram
 
         diagrams_dir = output_dir / "diagrams"
@@ -301,32 +563,42 @@ class ResearchAnalyser:
             logger.warning("Beautiful Mermaid render script not found in %s", self._beautiful_mermaid_dir)
             return []
 
-        results = []
-        for dtype in diagram_types:
+        async def _render_one(dtype: str):
             mermaid_code = self._content_to_mermaid(content, dtype)
             svg_path = diagrams_dir / f"{dtype}.svg"
             png_path = diagrams_dir / f"{dtype}.png"
 
             try:
-                proc = subprocess.run(
-                    ["node", str(render_script), "github-dark"],
-                    input=mermaid_code,
-                    capture_output=True,
-                    text=True,
+                proc = await asyncio.create_subprocess_exec(
+                    "node", str(render_script), "github-dark",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                     cwd=str(self._beautiful_mermaid_dir),
-                    timeout=30,
                 )
+                try:
+                    stdout, stderr = await asyncio.wait_for(
+                        proc.communicate(mermaid_code.encode()), timeout=30
+                    )
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
                 if proc.returncode != 0:
-                    logger.warning("Beautiful Mermaid failed for %s: %s", dtype, proc.stderr)
-                    continue
+                    logger.warning(
+                        "Beautiful Mermaid failed for %s: %s",
+                        dtype, stderr.decode(errors="replace"),
+                    )
+                    return None
 
-                svg_path.write_text(proc.stdout, encoding="utf-8")
+                svg_path.write_bytes(stdout)
 
                 # Convert SVG → PNG if cairosvg is available
                 try:
                     import cairosvg
-                    cairosvg.svg2png(
-                        bytestring=proc.stdout.encode(),
+                    await asyncio.to_thread(
+                        cairosvg.svg2png,
+                        bytestring=stdout,
                         write_to=str(png_path),
                         output_width=1600,
                     )
@@ -334,22 +606,23 @@ class ResearchAnalyser:
                 except ImportError:
                     final_path = svg_path
 
-                results.append(
-                    GeneratedDiagram(
-                        diagram_type=dtype,
-                        image_path=str(final_path),
-                        caption=f"{dtype.title()} diagram (Beautiful Mermaid): {content.title}",
-                        source_context=mermaid_code[:500],
-                        iterations=1,
-                        format=final_path.suffix.lstrip("."),
-                        is_fallback=False,
-                    )
-                )
                 logger.info("Beautiful Mermaid diagram generated: %s", final_path)
+                return GeneratedDiagram(
+                    diagram_type=dtype,
+                    image_path=str(final_path),
+                    caption=f"{dtype.title()} diagram (Beautiful Mermaid): {content.title}",
+                    source_context=mermaid_code[:500],
+                    iterations=1,
+                    format=final_path.suffix.lstrip("."),
+                    is_fallback=False,
+                )
             except Exception as exc:
                 logger.error("Beautiful Mermaid generation failed for %s: %s", dtype, exc)
+                return None
 
-        return results
+        # One node process per diagram type, rendered concurrently
+        rendered = await asyncio.gather(*(_render_one(dtype) for dtype in diagram_types))
+        return [d for d in rendered if d is not None]
 
     @staticmethod
     def _content_to_mermaid(content, diagram_type: str) -> str:
@@ -400,55 +673,71 @@ class ResearchAnalyser:
         edges = [f"    S{i} --> S{i+1}" for i in range(len(sections) - 1)]
         return "graph TD\n" + "\n".join(nodes) + "\n" + "\n".join(edges)
 
-    def _extract_methodology_summary(self, content) -> str:
-        """Extract methodology summary from sections.
+    def _extract_summaries(
+        self, content, abstract_500: str | None = None
+    ) -> tuple[str, str, str]:
+        """Return (methodology, results, conclusions) summaries.
 
-        Strategy (in order):
-        1. Broad title keyword match
-        2. Content keyword match (look for "we propose", "algorithm", etc.)
-        3. Positional fallback: sections 1–4 (intro is usually section 0)
-        4. Full-text at offset 1000+ to skip the abstract area
+        The title-keyword stage of all three is a single pass over the
+        sections with each title lower-cased once; the pass stops as soon as
+        all three are found.  Anything still missing falls through to the
+        per-summary content-keyword / positional / full-text strategies.
+
+        ``abstract_500`` is the caller's ``content.abstract[:500]`` (the
+        conclusions fallback), so ``analyse()`` slices the abstract only once.
         """
-        abstract = (content.abstract or "").strip()
+        abstract_head = (content.abstract or "").strip()[:200]
 
         def _distinct(text: str) -> bool:
             t = text.strip()
-            return bool(t) and t[:200] != abstract[:200]
-
-        METHOD_TITLE_KWS = [
-            "method", "approach", "proposed", "framework", "technique",
-            "model", "algorithm", "system", "design", "pipeline",
-            "architecture", "contribution", "formulation", "solution",
-            "overview", "our ",
-        ]
-        METHOD_CONTENT_KWS = [
-            "we propose", "we present", "our method", "our approach",
-            "the proposed", "algorithm", "architecture", "pipeline",
-            "formulation", "framework",
-        ]
-
-        # 1. Title keyword match
+            return bool(t) and t[:200] != abstract_head
+
+        methodology = results = conclusions = None
         for section in content.sections:
-            if any(kw in section.title.lower() for kw in METHOD_TITLE_KWS):
+            title = section.title.lower()
+            if methodology is None and any(kw in title for kw in _METHOD_TITLE_KWS):
                 text = section.content[:500].strip()
                 if _distinct(text):
-                    return text
-
-        # 2. Content keyword match
-        for section in content.sections:
-            if any(kw in section.content.lower() for kw in METHOD_CONTENT_KWS):
+                    methodology = text
+            if results is None and any(kw in title for kw in _RESULTS_TITLE_KWS):
                 text = section.content[:500].strip()
                 if _distinct(text):
-                    return text
+                    results = text
+            if conclusions is None and any(kw in title for kw in _CONCLUSION_TITLE_KWS):
+                conclusions = section.content[:500]
+            if methodology is not None and results is not None and conclusions is not None:
+                break
+
+        if methodology is None:
+            methodology = self._methodology_fallback(content, _distinct)
+        if results is None:
+            results = self._results_fallback(content, _distinct)
+        if conclusions is None:
+            if abstract_500 is None:
+                abstract_500 = content.abstract[:500] if content.abstract else ""
+            conclusions = abstract_500
+        return methodology, results, conclusions
 
-        # 3. Positional fallback: skip section 0 (usually intro), try 1–4
-        if len(content.sections) > 1:
-            for sec in content.sections[1:5]:
-                text = sec.content[:500].strip()
-                if _distinct(text):
-                    return text
+    @staticmethod
+    def _methodology_fallback(content, _distinct) -> str:
+        """Methodology summary when no section title matched.
 
-        # 4. Full-text at offset (beyond abstract area)
+        Strategy (in order):
+        1. Content keyword match (look for "we propose", "algorithm", etc.)
+        2. Positional fallback: sections 1–4 (intro is usually section 0)
+        3. Full-text at offset 1000+ to skip the abstract area
+        """
+        sections = content.sections
+        text = (
+            # 1. Content keyword match
+            _first_distinct(sections, _distinct, _METHOD_CONTENT_RE)
+            # 2. Positional fallback: skip section 0 (usually intro), try 1–4
+            or _first_distinct(sections[1:5], _distinct)
+        )
+        if text:
+            return text
+
+        # 3. Full-text at offset (beyond abstract area)
         if content.full_text and len(content.full_text) > 1000:
             chunk = content.full_text[1000:1500].strip()
             # Skip if it's just page-marker lines
@@ -459,55 +748,25 @@ class ResearchAnalyser:
 
         return ""
 
-    def _extract_results_summary(self, content) -> str:
-        """Extract results summary from sections.
+    @staticmethod
+    def _results_fallback(content, _distinct) -> str:
+        """Results summary when no section title matched.
 
         Strategy (in order):
-        1. Broad title keyword match
-        2. Content keyword match in the latter half of sections
-        3. Positional fallback: last few non-conclusion sections
-        4. Full-text from the latter portion of the paper
+        1. Content keyword match in the latter half of sections
+        2. Positional fallback: last few non-conclusion sections
+        3. Full-text from the latter portion of the paper
         """
-        abstract = (content.abstract or "").strip()
-
-        def _distinct(text: str) -> bool:
-            t = text.strip()
-            return bool(t) and t[:200] != abstract[:200]
-
-        RESULTS_TITLE_KWS = [
-            "result", "experiment", "evaluation", "performance",
-            "benchmark", "comparison", "analysis", "ablation",
-            "finding", "quantitative", "accuracy", "discussion",
-        ]
-        RESULTS_CONTENT_KWS = [
-            "table", "accuracy", "f1", "precision", "recall",
-            "outperforms", "baseline", "state-of-the-art", "sota",
-            "improvement", "score", "metric", "% ",
-        ]
-
-        # 1. Title keyword match
-        for section in content.sections:
-            if any(kw in section.title.lower() for kw in RESULTS_TITLE_KWS):
-                text = section.content[:500].strip()
-                if _distinct(text):
-                    return text
-
-        # 2. Content keyword match in latter half
-        mid = max(0, len(content.sections) // 2)
-        for section in content.sections[mid:]:
-            if any(kw in section.content.lower() for kw in RESULTS_CONTENT_KWS):
-                text = section.content[:500].strip()
-                if _distinct(text):
-                    return text
-
-        # 3. Positional fallback: work backwards from second-to-last section
-        if len(content.sections) >= 3:
-            for sec in reversed(content.sections[:-1]):
-                text = sec.content[:500].strip()
-                if _distinct(text):
-                    return text
-
-        # 4. Full-text from latter portion — strip page-marker lines before returning
+        sections = content.sections
+        # 1. Content keyword match in latter half
+        text = _first_distinct(sections[len(sections) // 2:], _distinct, _RESULTS_CONTENT_RE)
+        # 2. Positional fallback: work backwards from second-to-last section
+        if not text and len(sections) >= 3:
+            text = _first_distinct(reversed(sections[:-1]), _distinct)
+        if text:
+            return text
+
+        # 3. Full-text from latter portion — strip page-marker lines before returning
         def _clean(chunk: str) -> str:
             lines = [l for l in chunk.splitlines() if not l.strip().startswith("## Page")]
             return " ".join(lines).strip()
@@ -523,15 +782,6 @@ class ResearchAnalyser:
 
         return ""
 
-    def _extract_conclusions(self, content) -> str:
-        """Extract conclusions from sections."""
-        for section in content.sections:
-            if "conclusion" in section.title.lower():
-                return section.content[:500]
-        if content.abstract:
-            return content.abstract[:500]
-        return ""
-
     def _extract_key_points(self, content, review) -> list[KeyPoint]:
         """Extract key points from content and review."""
         points = []
@@ -560,13 +810,14 @@ class ResearchAnalyser:
                 )
 
         # From key equations
-        display_eqs = [eq for eq in content.equations if not eq.is_inline]
-        if display_eqs:
+        first_eq = next((eq for eq in content.equations if not eq.is_inline), None)
+        if first_eq is not None:
+            n_display = sum(1 for eq in content.equations if not eq.is_inline)
             points.append(
                 KeyPoint(
-                    point=f"Paper includes {len(display_eqs)} key equations/formulae",
-                    evidence=f"First equation: {display_eqs[0].latex[:100]}",
-                    section=display_eqs[0].section,
+                    point=f"Paper includes {n_display} key equations/formulae",
+                    evidence=f"First equation: {first_eq.latex[:100]}",
+                    section=first_eq.section,
                     importance="medium",
                 )
             )
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
+import hashlib
 import json
 import logging
+import os
+import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator, Optional
@@ -23,9 +29,15 @@ if _os.path.isdir(_brew_lib):
         _brew_lib + ":" + _os.environ.get("DYLD_FALLBACK_LIBRARY_PATH", ""),
     )
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import FastAPI, File, Form, HTTPException, Response, UploadFile
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # optional speed-up — fall back to the stdlib json module
+    orjson = None
+
 try:
     from sse_starlette.sse import EventSourceResponse
     _SSE_AVAILABLE = True
@@ -34,6 +46,8 @@ except ImportError:
 
 from research_analyser.analyser import ResearchAnalyser
 from research_analyser.config import Config
+from research_analyser.input_handler import extract_paper_id
+from research_analyser.job_store import make_job_store
 from research_analyser.models import AnalysisOptions
 
 logger = logging.getLogger(__name__)
@@ -48,17 +62,123 @@ def _json_default(obj):
     raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
+def _json_bytes(obj) -> bytes:
+    """Serialise *obj* to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def _json_text(obj) -> str:
+    """JSON text for SSE ``data`` fields."""
+    return _json_bytes(obj).decode("utf-8")
+
+
+def _hash_and_copy(src, dest: Path) -> str:
+    """Copy *src* to *dest* in 1 MiB chunks, returning the BLAKE2b digest."""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(dest, "wb") as out:
+        while chunk := src.read(1024 * 1024):
+            digest.update(chunk)
+            out.write(chunk)
+    return digest.hexdigest()
+
+
+def _store_upload(src, upload_dir: Path, filename: str) -> tuple[Path, str]:
+    fd, tmp_name = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        digest = _hash_and_copy(src, tmp_path)
+        # The file keeps its (sanitised) original stem, which extract_paper_id
+        # turns into the paper ID / output folder name.
+        dest = upload_dir / digest / f"{extract_paper_id(Path(filename).name)}.pdf"
+        if dest.exists():
+            tmp_path.unlink()
+        else:
+            dest.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return dest, digest
+
+
+async def _save_upload(file: UploadFile, upload_dir: Path) -> tuple[Path, str]:
+    """Store an upload content-addressed under *upload_dir* in a worker thread.
+
+    Starlette has already spooled large uploads to a temp file, so copying
+    from ``file.file`` never holds the whole PDF in memory. The content hash
+    is computed during the same pass and names the directory the file is
+    stored in (``<digest>/<name>.pdf``), so repeat uploads of one PDF share a
+    single copy. Returns ``(path, digest)``.
+    """
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    return await asyncio.to_thread(
+        _store_upload, file.file, upload_dir, file.filename or "upload.pdf"
+    )
+
+
+def _upload_job_id(digest: str, options: AnalysisOptions) -> str:
+    """Deterministic job id for an uploaded PDF analysed with *options*."""
+    key = json.dumps(
+        {"pdf": digest, "options": dataclasses.asdict(options)}, sort_keys=True
+    )
+    return str(uuid.UUID(bytes=hashlib.blake2b(key.encode(), digest_size=16).digest()))
+
+
+config = Config.load()
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # Dedicated, sized pool for asyncio.to_thread (OCR, STORM, uploads,
+    # report serialisation) so long OCR runs can't starve the short offloads.
+    executor = ThreadPoolExecutor(
+        max_workers=config.api.io_threads, thread_name_prefix="ra-io"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    # The OCR model stays resident in this process for every job; load it in
+    # the background now so the first analysis doesn't pay the cold start.
+    preload = (
+        asyncio.create_task(analyser.ocr_engine.warmup())
+        if config.api.preload_ocr else None
+    )
+    try:
+        yield
+        # Let report files from wait_for_disk=False analyses finish writing
+        await analyser.wait_for_pending_saves()
+    finally:
+        if preload is not None:
+            preload.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="Research Analyser API",
     description="AI-powered research paper analysis",
     version="0.1.0",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
-# In-memory job store (replace with Redis/DB for production)
-jobs: dict[str, dict] = {}
-config = Config.load()
+# Background-job status; "sqlite" lets several uvicorn workers share it
+job_store = make_job_store(
+    config.api.job_store,
+    config.api.job_store_path,
+    config.api.job_ttl_seconds,
+    max_jobs=config.api.job_max_entries,
+)
 analyser = ResearchAnalyser(config=config)
 
+# Caps concurrent OCR + LLM pipelines; extra requests wait their turn
+_job_sem = asyncio.Semaphore(config.api.max_concurrent_jobs)
+
+
+async def _analyse_limited(source: str, **kwargs):
+    async with _job_sem:
+        return await analyser.analyse(source, **kwargs)
+
 
 class AnalyseRequest(BaseModel):
     source: str
@@ -98,30 +218,38 @@ async def analyse_paper(
     generate_review: bool = Form(True),
     generate_audio: bool = Form(False),
 ):
-    """Submit a paper for analysis. Upload a PDF file or provide a URL/arXiv ID."""
-    job_id = str(uuid.uuid4())
+    """Submit a paper for analysis. Upload a PDF file or provide a URL/arXiv ID.
+
+    Uploads are keyed by content hash and options, so resubmitting a PDF
+    that is already queued, running or done returns that job instead of
+    starting another analysis.
+    """
+    options = AnalysisOptions(
+        generate_diagrams=generate_diagrams,
+        generate_review=generate_review,
+        generate_audio=generate_audio,
+        wait_for_disk=False,
+    )
 
     if file:
-        # Save uploaded file
-        upload_dir = Path(config.app.temp_dir) / "uploads"
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        file_path = upload_dir / f"{job_id}_{file.filename}"
-        content = await file.read()
-        file_path.write_bytes(content)
+        file_path, digest = await _save_upload(file, Path(config.app.temp_dir) / "uploads")
         paper_source = str(file_path)
+        job_id = _upload_job_id(digest, options)
+        # Atomic claim: concurrent uploads of one PDF start a single analysis
+        if not await job_store.create_if_absent(job_id):
+            existing = await job_store.get(job_id)
+            return JobResponse(
+                job_id=job_id,
+                status=existing["status"] if existing else "queued",
+                message="Same PDF and options already submitted",
+            )
     elif source:
         paper_source = source
+        job_id = str(uuid.uuid4())
+        await job_store.create(job_id)
     else:
         raise HTTPException(status_code=400, detail="Provide either a file or source URL")
 
-    jobs[job_id] = {"status": "queued", "report": None, "error": None}
-
-    options = AnalysisOptions(
-        generate_diagrams=generate_diagrams,
-        generate_review=generate_review,
-        generate_audio=generate_audio,
-    )
-
     # Run analysis in background
     asyncio.create_task(_run_analysis(job_id, paper_source, options))
 
@@ -129,25 +257,26 @@ async def analyse_paper(
 
 
 async def _run_analysis(job_id: str, source: str, options: AnalysisOptions):
-    """Run analysis as a background task."""
-    jobs[job_id]["status"] = "processing"
+    """Run analysis as a background task (stays "queued" until a slot frees)."""
     try:
-        report = await analyser.analyse(source, options=options)
-        jobs[job_id]["status"] = "completed"
-        jobs[job_id]["report"] = report.to_json()
+        async with _job_sem:
+            await job_store.update(job_id, status="processing")
+            report = await analyser.analyse(source, options=options)
+        # to_json() deep-copies the whole report; keep it off the event loop
+        report_json = await asyncio.to_thread(report.to_json)
+        await job_store.update(job_id, status="completed", report=report_json)
     except Exception as e:
         logger.error(f"Job {job_id} failed: {e}")
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["error"] = str(e)
+        await job_store.update(job_id, status="failed", error=str(e))
 
 
 @app.get("/api/v1/analyse/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str):
     """Get analysis job status and results."""
-    if job_id not in jobs:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = jobs[job_id]
     return JobStatusResponse(
         job_id=job_id,
         status=job["status"],
@@ -165,30 +294,48 @@ async def extract_only(
     options = AnalysisOptions(
         generate_diagrams=False,
         generate_review=False,
+        wait_for_disk=False,
     )
 
     if file:
-        upload_dir = Path(config.app.temp_dir) / "uploads"
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        file_path = upload_dir / file.filename
-        content = await file.read()
-        file_path.write_bytes(content)
+        file_path, _ = await _save_upload(file, Path(config.app.temp_dir) / "uploads")
         paper_source = str(file_path)
     elif source:
         paper_source = source
     else:
         raise HTTPException(status_code=400, detail="Provide either a file or source URL")
 
-    report = await analyser.analyse(paper_source, options=options)
-    return report.to_json()
+    report = await _analyse_limited(paper_source, options=options)
+    return await asyncio.to_thread(report.to_json)
 
 
 # ---------------------------------------------------------------------------
 # VS Code Extension-compatible endpoints
 # ---------------------------------------------------------------------------
 
-# Shared storage for the last completed report (in-memory, single-user)
-_last_report: Optional[dict] = None
+# The last completed report (in-memory, single-user), kept pre-serialised so
+# /report/latest and /equations hand out bytes without re-encoding the dict.
+_last_report_json: bytes | None = None
+_last_equations_json: bytes | None = None
+
+
+def _serialise_report(report) -> tuple[bytes, bytes]:
+    data = report.to_json()
+    equations = data.get("extracted_content", {}).get("equations", [])
+    return _json_bytes(data), _json_bytes(equations)
+
+
+async def _remember_report(report) -> bytes:
+    """Cache *report* as the latest one and return its JSON bytes."""
+    global _last_report_json, _last_equations_json
+    _last_report_json, _last_equations_json = await asyncio.to_thread(
+        _serialise_report, report
+    )
+    return _last_report_json
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
 
 
 class VSCodeAnalyseRequest(BaseModel):
@@ -205,25 +352,24 @@ async def health():
 @app.get("/report/latest")
 async def get_latest_report():
     """Return the most recent analysis report (for VS Code extension auto-load)."""
-    if _last_report is None:
+    if _last_report_json is None:
         raise HTTPException(status_code=404, detail="No report available")
-    return _last_report
+    return _json_response(_last_report_json)
 
 
 @app.post("/analyse")
 async def analyse_blocking(req: VSCodeAnalyseRequest):
     """Run analysis and return the full report (blocking, 300 s budget)."""
-    global _last_report
     options = AnalysisOptions(
         generate_diagrams=req.options.get("generate_diagrams", True) if req.options else True,
         generate_review=req.options.get("generate_review", True) if req.options else True,
         generate_audio=req.options.get("generate_audio", False) if req.options else False,
         diagram_engine=req.options.get("diagram_engine", "paperbanana") if req.options else "paperbanana",
+        wait_for_disk=False,
     )
     try:
-        report = await analyser.analyse(req.source, options=options)
-        _last_report = report.to_json()
-        return _last_report
+        report = await _analyse_limited(req.source, options=options)
+        return _json_response(await _remember_report(report))
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -237,20 +383,19 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
             detail="SSE streaming not available. Install sse-starlette: pip install sse-starlette",
         )
 
-    global _last_report
     options = AnalysisOptions(
         generate_diagrams=req.options.get("generate_diagrams", True) if req.options else True,
         generate_review=req.options.get("generate_review", True) if req.options else True,
         generate_audio=req.options.get("generate_audio", False) if req.options else False,
         diagram_engine=req.options.get("diagram_engine", "paperbanana") if req.options else "paperbanana",
+        wait_for_disk=False,
     )
 
     async def generate() -> AsyncGenerator[dict, None]:
-        global _last_report
         try:
             yield {
                 "event": "progress",
-                "data": json.dumps({"pct": 5, "message": "Starting analysis…"}),
+                "data": _json_text({"pct": 5, "message": "Starting analysis…"}),
             }
 
             # Queue bridges the sync on_progress callback → async SSE stream
@@ -263,6 +408,7 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
             _pct_steps = [
                 ("⬇️", 10), ("✓  PDF", 20), ("🔍", 25),
                 ("✓  Extracted", 50), ("🤖", 55),
+                ("✓  Diagrams", 70), ("✓  Peer review", 75),
                 ("🌪️", 85), ("🎙️", 90),
             ]
 
@@ -274,7 +420,7 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
 
             current_pct = 5
             task = asyncio.create_task(
-                analyser.analyse(req.source, options=options, on_progress=_on_progress)
+                _analyse_limited(req.source, options=options, on_progress=_on_progress)
             )
 
             # Drain progress messages while the analysis task is running
@@ -284,7 +430,7 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
                     current_pct = _resolve_pct(msg, current_pct)
                     yield {
                         "event": "progress",
-                        "data": json.dumps({"pct": current_pct, "message": msg}),
+                        "data": _json_text({"pct": current_pct, "message": msg}),
                     }
                 except asyncio.TimeoutError:
                     pass
@@ -295,7 +441,7 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
                 current_pct = _resolve_pct(msg, current_pct)
                 yield {
                     "event": "progress",
-                    "data": json.dumps({"pct": current_pct, "message": msg}),
+                    "data": _json_text({"pct": current_pct, "message": msg}),
                 }
 
             # Re-raise any exception from the task
@@ -304,13 +450,12 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
                 raise exc
 
             report = task.result()
-            _last_report = report.to_json()
-
             yield {
                 "event": "progress",
-                "data": json.dumps({"pct": 98, "message": "Finalising report…"}),
+                "data": _json_text({"pct": 98, "message": "Finalising report…"}),
             }
-            yield {"event": "complete", "data": json.dumps(_last_report, default=_json_default)}
+            payload = await _remember_report(report)
+            yield {"event": "complete", "data": payload.decode("utf-8")}
         except Exception as exc:
             logger.error("SSE analysis failed: %s", exc)
             msg = str(exc)
@@ -323,7 +468,7 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
                     "CA certificate path (researchAnalyser.network.sslCertPath) and "
                     "run 'Research Analyser: Save Network Settings → .env'."
                 )
-            yield {"event": "error", "data": json.dumps({"message": msg})}
+            yield {"event": "error", "data": _json_text({"message": msg})}
 
     return EventSourceResponse(generate())
 
@@ -331,12 +476,9 @@ async def analyse_stream(req: VSCodeAnalyseRequest):
 @app.get("/equations")
 async def get_equations():
     """Return equations from the latest report (without loading the full report)."""
-    if _last_report is None:
+    if _last_equations_json is None:
         raise HTTPException(status_code=404, detail="No report available")
-    equations = (
-        _last_report.get("extracted_content", {}).get("equations", [])
-    )
-    return equations
+    return _json_response(_last_equations_json)
 
 
 # ---------------------------------------------------------------------------
@@ -363,7 +505,13 @@ async def fetch_paper(req: FetchRequest):
     from research_analyser.input_handler import InputHandler
     from research_analyser.models import PaperInput
 
-    handler = InputHandler(temp_dir=config.app.temp_dir)
+    handler = InputHandler(
+        temp_dir=config.app.temp_dir,
+        connect_timeout=config.app.connect_timeout,
+        read_timeout=config.app.read_timeout,
+        retry_attempts=config.app.retry_attempts,
+        download_ttl=config.app.download_cache_ttl,
+    )
 
     try:
         source_type = handler.detect_source_type(req.source)
@@ -1314,7 +1462,7 @@ async def generate_diagram_stream(req: DiagramRequest):
                 # ── Beautiful Mermaid (local, synchronous steps) ─────────────
                 yield {
                     "event": "progress",
-                    "data": json.dumps({"pct": 10, "message": "Generating Mermaid code…"}),
+                    "data": _json_text({"pct": 10, "message": "Generating Mermaid code…"}),
                 }
                 mermaid_code = _text_to_mermaid(req.text, req.diagram_type)
 
@@ -1324,7 +1472,7 @@ async def generate_diagram_stream(req: DiagramRequest):
                 if not render_script.exists():
                     yield {
                         "event": "error",
-                        "data": json.dumps({"message": f"Beautiful Mermaid render script not found in {analyser._beautiful_mermaid_dir}"}),
+                        "data": _json_text({"message": f"Beautiful Mermaid render script not found in {analyser._beautiful_mermaid_dir}"}),
                     }
                     return
 
@@ -1335,7 +1483,7 @@ async def generate_diagram_stream(req: DiagramRequest):
 
                 yield {
                     "event": "progress",
-                    "data": json.dumps({"pct": 40, "message": "Rendering SVG…"}),
+                    "data": _json_text({"pct": 40, "message": "Rendering SVG…"}),
                 }
                 import subprocess as _sp
                 proc = await asyncio.to_thread(
@@ -1350,7 +1498,7 @@ async def generate_diagram_stream(req: DiagramRequest):
                 if proc.returncode != 0:
                     yield {
                         "event": "error",
-                        "data": json.dumps({"message": f"Mermaid render failed: {proc.stderr}"}),
+                        "data": _json_text({"message": f"Mermaid render failed: {proc.stderr}"}),
                     }
                     return
 
@@ -1359,7 +1507,7 @@ async def generate_diagram_stream(req: DiagramRequest):
 
                 yield {
                     "event": "progress",
-                    "data": json.dumps({"pct": 80, "message": "Converting to PNG…"}),
+                    "data": _json_text({"pct": 80, "message": "Converting to PNG…"}),
                 }
                 png_generated = False
                 try:
@@ -1389,7 +1537,7 @@ async def generate_diagram_stream(req: DiagramRequest):
                 )
                 yield {
                     "event": "complete",
-                    "data": json.dumps(result.model_dump(), default=_json_default),
+                    "data": _json_text(result.model_dump()),
                 }
 
             else:
@@ -1418,7 +1566,7 @@ async def generate_diagram_stream(req: DiagramRequest):
                 for (pct, msg), delay in zip(pb_stages, stage_delays):
                     yield {
                         "event": "progress",
-                        "data": json.dumps({"pct": pct, "message": msg}),
+                        "data": _json_text({"pct": pct, "message": msg}),
                     }
                     try:
                         await asyncio.wait_for(asyncio.shield(task), timeout=delay)
@@ -1446,14 +1594,14 @@ async def generate_diagram_stream(req: DiagramRequest):
 
                 yield {
                     "event": "complete",
-                    "data": json.dumps(result.model_dump(), default=_json_default),
+                    "data": _json_text(result.model_dump()),
                 }
 
         except Exception as _exc:
             logger.error("Diagram stream generation failed: %s", _exc)
             yield {
                 "event": "error",
-                "data": json.dumps({"message": str(_exc)}),
+                "data": _json_text({"message": str(_exc)}),
             }
 
     return EventSourceResponse(_event_generator())
@@ -16,6 +16,7 @@ class OCRConfig(BaseModel):
     device: str = "auto"
     page_split: bool = True
     output_format: str = "markdown"
+    cache_enabled: bool = True  # reuse OCR output for identical PDFs
 
 
 class DiagramConfig(BaseModel):
@@ -35,6 +36,7 @@ class TTSConfig(BaseModel):
     model: str = "Qwen/Qwen3-TTS"
     device: str = "auto"
     speaker: str = "default"
+    timeout_seconds: float = Field(default=600, gt=0)  # whole narration
 
 
 class ReviewScoringWeights(BaseModel):
@@ -49,6 +51,7 @@ class ReviewConfig(BaseModel):
     use_tavily: bool = True
     scoring_weights: ReviewScoringWeights = Field(default_factory=ReviewScoringWeights)
     intercept: float = -0.3057
+    cache_enabled: bool = True  # reuse the review for identical paper text
 
 
 class StormConfig(BaseModel):
@@ -60,6 +63,8 @@ class StormConfig(BaseModel):
     max_perspective: int = Field(default=3, ge=1)
     search_top_k: int = Field(default=5, ge=1)
     retrieve_top_k: int = Field(default=5, ge=1)
+    cache_enabled: bool = True  # reuse the article for identical paper text
+    timeout_seconds: float = Field(default=900, gt=0)  # whole article
 
 
 class APIConfig(BaseModel):
@@ -67,6 +72,13 @@ class APIConfig(BaseModel):
     port: int = 8000
     max_upload_size_mb: int = 100
     job_timeout_seconds: int = 600
+    max_concurrent_jobs: int = Field(default=2, ge=1)  # analyses running at once
+    io_threads: int = Field(default=16, ge=1)  # worker threads for to_thread offloads
+    job_store: str = "memory"  # "memory" (single process) or "sqlite" (multi-worker)
+    job_store_path: str = "./tmp/jobs.sqlite3"
+    job_ttl_seconds: int = Field(default=86400, ge=60)  # finished jobs kept this long
+    job_max_entries: int = Field(default=1000, ge=1)  # oldest finished jobs evicted past this
+    preload_ocr: bool = True  # load the OCR model at startup, not on the first request
 
 
 class AppConfig(BaseModel):
@@ -74,6 +86,12 @@ class AppConfig(BaseModel):
     output_dir: str = "./output"
     temp_dir: str = "./tmp"
     log_level: str = "INFO"
+    # Outbound HTTP (paper downloads, arXiv / DOI lookups)
+    connect_timeout: float = Field(default=3.0, gt=0)
+    read_timeout: float = Field(default=30.0, gt=0)
+    retry_attempts: int = Field(default=3, ge=1)
+    # Reuse a remote paper downloaded this recently (seconds; 0 = always refetch)
+    download_cache_ttl: float = Field(default=86400, ge=0)
 
 
 class Config(BaseSettings):
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
+import functools
+import hashlib
 import logging
 import json
 import os
+import random
 import re
 import ssl
 import tempfile
 import tarfile
+import time
 import xml.etree.ElementTree as ET
 from io import BytesIO
 from pathlib import Path
@@ -21,6 +28,19 @@ from research_analyser.models import PaperInput, SourceType
 
 logger = logging.getLogger(__name__)
 
+# Session shared by every request made during one resolve() call (arXiv
+# fetches the PDF, metadata and TeX source), so they reuse pooled
+# keep-alive connections instead of a fresh TCP/TLS handshake each.
+_shared_session: contextvars.ContextVar[aiohttp.ClientSession | None] = (
+    contextvars.ContextVar("input_handler_session", default=None)
+)
+
+# Directory the current resolve() downloads into: one per source, so two
+# URLs that end in the same file name never overwrite each other.
+_download_dir: contextvars.ContextVar[Path | None] = contextvars.ContextVar(
+    "input_handler_download_dir", default=None
+)
+
 # arXiv ID patterns
 ARXIV_PATTERNS = [
     re.compile(r"arxiv\.org/abs/(\d{4}\.\d{4,5}(?:v\d+)?)"),
@@ -31,6 +51,23 @@ ARXIV_PATTERNS = [
 DOI_PATTERN = re.compile(r"^10\.\d{4,}/[^\s]+$")
 
 
+@functools.lru_cache(maxsize=1024)
+def _remote_source_type(source: str) -> SourceType | None:
+    """Classify a non-file source by pattern alone (pure, so memoised for
+    clients that resubmit the same URL / ID); None if nothing matches."""
+    for pattern in ARXIV_PATTERNS:
+        if pattern.search(source):
+            return SourceType.ARXIV_ID
+
+    if DOI_PATTERN.match(source):
+        return SourceType.DOI
+
+    if source.startswith(("http://", "https://")):
+        return SourceType.PDF_URL
+
+    return None
+
+
 def extract_paper_id(source: str) -> str:
     """Extract a filesystem-safe paper ID from source string.
 
@@ -73,9 +110,25 @@ def extract_paper_id(source: str) -> str:
 class InputHandler:
     """Resolve and fetch papers from various input sources."""
 
-    def __init__(self, temp_dir: Optional[str] = None):
+    def __init__(
+        self,
+        temp_dir: str | None = None,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 30.0,
+        retry_attempts: int = 3,
+        download_ttl: float = 0.0,
+    ):
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp())
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_attempts = retry_attempts
+        # Remote sources downloaded less than download_ttl seconds ago are
+        # served from temp_dir (0 disables); see resolve().
+        self.download_ttl = download_ttl
+        self._index_path = self.temp_dir / "downloads.json"
+        # Downloads in progress, so concurrent resolves of one source share it
+        self._inflight: dict[str, asyncio.Task] = {}
         # Optional per-request warning callback; set by callers (e.g. analyser)
         self._on_warning = None
 
@@ -138,27 +191,139 @@ class InputHandler:
 
     def detect_source_type(self, source: str) -> SourceType:
         """Auto-detect the type of input source."""
+        # Checked every call: whether the file exists can change
         path = Path(source)
         if path.exists() and path.suffix.lower() == ".pdf":
             return SourceType.PDF_FILE
 
-        for pattern in ARXIV_PATTERNS:
-            if pattern.search(source):
-                return SourceType.ARXIV_ID
+        source_type = _remote_source_type(source)
+        if source_type is None:
+            raise InputError(f"Cannot determine source type for: {source}")
+        return source_type
 
-        if DOI_PATTERN.match(source):
-            return SourceType.DOI
+    def _timeout(self, total: float) -> aiohttp.ClientTimeout:
+        """Overall deadline plus the configured connect / socket-read limits."""
+        return aiohttp.ClientTimeout(
+            total=total, connect=self.connect_timeout, sock_read=self.read_timeout
+        )
 
-        if source.startswith(("http://", "https://")):
-            return SourceType.PDF_URL
+    async def _stream_to(self, resp: aiohttp.ClientResponse, output_path: Path) -> int:
+        """Write the response body to *output_path* in 64 KiB chunks.
 
-        raise InputError(f"Cannot determine source type for: {source}")
+        The body lands in a temp file beside the target and is renamed into
+        place, so the PDF is never held in memory whole and a dropped
+        connection never leaves a truncated file at *output_path*.
+        """
+        size = 0
+        with tempfile.NamedTemporaryFile(
+            dir=output_path.parent, suffix=".part", delete=False
+        ) as tmp:
+            try:
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    tmp.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        os.replace(tmp.name, output_path)
+        return size
+
+    @contextlib.asynccontextmanager
+    async def _client(self):
+        """Yield the session of the enclosing resolve(), or a one-off session."""
+        session = _shared_session.get()
+        if session is not None and not session.closed:
+            yield session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
 
     async def resolve(self, paper_input: PaperInput) -> Path:
-        """Resolve input to a local PDF file path."""
+        """Resolve input to a local PDF file path.
+
+        Remote sources are single-flight: concurrent calls for the same
+        source await one download, and with ``download_ttl`` set a recent
+        download is reused from disk, also across processes and restarts.
+        """
+        if paper_input.source_type == SourceType.PDF_FILE:
+            return self._resolve_local(paper_input.source_value)
+
+        key = f"{paper_input.source_type.value}:{paper_input.source_value.strip()}"
+        cached = await asyncio.to_thread(self._recent_download, key)
+        if cached is not None:
+            logger.info("Reusing download of %s: %s", paper_input.source_value, cached)
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._download(paper_input, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        # shield: one caller giving up must not cancel the others' download
+        return await asyncio.shield(task)
+
+    async def _download(self, paper_input: PaperInput, key: str) -> Path:
+        out_dir = self.temp_dir / "downloads" / hashlib.sha256(key.encode()).hexdigest()[:32]
+        out_dir.mkdir(parents=True, exist_ok=True)
+        dir_token = _download_dir.set(out_dir)
+        try:
+            async with aiohttp.ClientSession() as session:
+                token = _shared_session.set(session)
+                try:
+                    path = await self._resolve_remote(paper_input)
+                finally:
+                    _shared_session.reset(token)
+        finally:
+            _download_dir.reset(dir_token)
+        if self.download_ttl > 0:
+            await asyncio.to_thread(self._record_download, key, path)
+        return path
+
+    def _output_dir(self) -> Path:
+        """Where downloads go: the per-source dir inside resolve(), else temp_dir."""
+        return _download_dir.get() or self.temp_dir
+
+    def _read_index(self) -> dict:
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable download index %s: %s", self._index_path, exc)
+            return {}
+
+    def _recent_download(self, key: str) -> Path | None:
+        if self.download_ttl <= 0:
+            return None
+        entry = self._read_index().get(key)
+        if not entry or time.time() - entry.get("fetched", 0) > self.download_ttl:
+            return None
+        path = Path(entry.get("path", ""))
+        return path if path.is_file() else None
+
+    def _record_download(self, key: str, path: Path) -> None:
+        index = self._read_index()
+        now = time.time()
+        index = {
+            k: v for k, v in index.items()
+            if now - v.get("fetched", 0) <= self.download_ttl
+        }
+        index[key] = {"path": str(path), "fetched": now}
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.temp_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(index, f)
+                os.replace(tmp, self._index_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as exc:
+            logger.warning("Could not update download index %s: %s", self._index_path, exc)
+
+    async def _resolve_remote(self, paper_input: PaperInput) -> Path:
         match paper_input.source_type:
-            case SourceType.PDF_FILE:
-                return self._resolve_local(paper_input.source_value)
             case SourceType.PDF_URL:
                 return await self.fetch_url(paper_input.source_value)
             case SourceType.ARXIV_ID:
@@ -208,11 +373,11 @@ class InputHandler:
         """Fetch TeX source bundle from arXiv e-print endpoint."""
         source_url = f"https://arxiv.org/e-print/{arxiv_id}"
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._client() as session:
                 async with await self._session_get(
                     session,
                     source_url,
-                    timeout=aiohttp.ClientTimeout(total=120),
+                    timeout=self._timeout(120),
                 ) as resp:
                     if resp.status != 200:
                         return None
@@ -245,11 +410,11 @@ class InputHandler:
         api_url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._client() as session:
                 async with await self._session_get(
                     session,
                     api_url,
-                    timeout=aiohttp.ClientTimeout(total=30),
+                    timeout=self._timeout(30),
                 ) as resp:
                     if resp.status != 200:
                         return None
@@ -280,38 +445,48 @@ class InputHandler:
             return None
 
     async def fetch_url(
-        self, url: str, filename: Optional[str] = None, max_retries: int = 3
+        self, url: str, filename: str | None = None, max_retries: int | None = None
     ) -> Path:
-        """Download PDF from URL with retry logic."""
+        """Download PDF from URL with retry logic.
+
+        Connection errors, timeouts and 5xx responses are retried with
+        jittered exponential backoff (0.5 s doubling, capped at 8 s); other
+        HTTP errors fail immediately.
+        """
+        if max_retries is None:
+            max_retries = self.retry_attempts
         if filename is None:
             filename = url.split("/")[-1]
             if not filename.endswith(".pdf"):
                 filename += ".pdf"
 
-        output_path = self.temp_dir / filename
+        output_path = self._output_dir() / filename
 
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
+                async with self._client() as session:
                     async with await self._session_get(
                         session,
                         url,
-                        timeout=aiohttp.ClientTimeout(total=120),
+                        timeout=self._timeout(120),
                     ) as resp:
-                        if resp.status != 200:
+                        if resp.status == 200:
+                            size = await self._stream_to(resp, output_path)
+                            logger.info(f"Downloaded {size} bytes to {output_path}")
+                            return output_path
+                        if resp.status < 500:
                             raise InputError(
                                 f"HTTP {resp.status} fetching {url}"
                             )
+                        error = f"HTTP {resp.status}"
 
-                        content = await resp.read()
-                        output_path.write_bytes(content)
-                        logger.info(f"Downloaded {len(content)} bytes to {output_path}")
-                        return output_path
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
 
-            except aiohttp.ClientError as e:
-                if attempt == max_retries - 1:
-                    raise InputError(f"Failed to fetch {url} after {max_retries} attempts: {e}")
-                logger.warning(f"Retry {attempt + 1}/{max_retries} for {url}: {e}")
+            if attempt == max_retries - 1:
+                raise InputError(f"Failed to fetch {url} after {max_retries} attempts: {error}")
+            logger.warning(f"Retry {attempt + 1}/{max_retries} for {url}: {error}")
+            await asyncio.sleep(min(8.0, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.0))
 
         raise InputError(f"Failed to fetch {url}")
 
@@ -320,7 +495,7 @@ class InputHandler:
         url = f"https://doi.org/{doi}"
         logger.info(f"Resolving DOI: {doi}")
 
-        async with aiohttp.ClientSession() as session:
+        async with self._client() as session:
             # Try direct PDF content negotiation
             headers = {"Accept": "application/pdf"}
             async with await self._session_get(
@@ -328,12 +503,11 @@ class InputHandler:
                 url,
                 headers=headers,
                 allow_redirects=True,
-                timeout=aiohttp.ClientTimeout(total=60),
+                timeout=self._timeout(60),
             ) as resp:
                 if resp.status == 200 and "pdf" in resp.content_type:
-                    output_path = self.temp_dir / f"doi_{doi.replace('/', '_')}.pdf"
-                    content = await resp.read()
-                    output_path.write_bytes(content)
+                    output_path = self._output_dir() / f"doi_{doi.replace('/', '_')}.pdf"
+                    await self._stream_to(resp, output_path)
                     return output_path
 
             # Fallback: get metadata to find PDF link
@@ -0,0 +1,204 @@
+"""Job-status storage for the API server's background analyses."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+# Fields a job record carries besides its id
+_FIELDS = ("status", "report", "error")
+_FINISHED = ("completed", "failed")
+
+
+class InMemoryJobStore:
+    """Per-process job store.
+
+    Finished jobs are evicted after ``ttl_seconds``, and the oldest finished
+    ones as well once more than ``max_jobs`` are held.
+    """
+
+    def __init__(self, ttl_seconds: float = 86400, max_jobs: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self._jobs: dict[str, dict] = {}
+        self._updated: dict[str, float] = {}
+
+    async def create(self, job_id: str) -> None:
+        self._purge_expired()
+        self._insert(job_id)
+
+    async def create_if_absent(self, job_id: str) -> bool:
+        """Create *job_id* unless a queued, running or completed job holds it.
+
+        A failed job is replaced, so it can be retried.  Returns whether the
+        job was created; check and insert happen without yielding.
+        """
+        self._purge_expired()
+        job = self._jobs.get(job_id)
+        if job is not None and job["status"] != "failed":
+            return False
+        self._insert(job_id)
+        return True
+
+    def _insert(self, job_id: str) -> None:
+        self._jobs[job_id] = {"status": "queued", "report": None, "error": None}
+        self._updated[job_id] = time.time()
+
+    async def update(self, job_id: str, **fields) -> None:
+        job = self._jobs.setdefault(
+            job_id, {"status": "queued", "report": None, "error": None}
+        )
+        job.update((k, v) for k, v in fields.items() if k in _FIELDS)
+        self._updated[job_id] = time.time()
+
+    async def get(self, job_id: str) -> dict | None:
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    def _purge_expired(self) -> None:
+        """Drop expired finished jobs, then the oldest finished ones over the cap
+        (leaving room for the job about to be created)."""
+        cutoff = time.time() - self.ttl_seconds
+        finished = sorted(
+            (ts, job_id) for job_id, ts in self._updated.items()
+            if self._jobs[job_id]["status"] in _FINISHED
+        )
+        excess = len(self._jobs) + 1 - self.max_jobs
+        for i, (ts, job_id) in enumerate(finished):
+            if ts >= cutoff and i >= excess:
+                break
+            del self._jobs[job_id]
+            del self._updated[job_id]
+
+
+class SQLiteJobStore:
+    """SQLite (WAL) job store, shared by every worker process on one host.
+
+    Calls run in worker threads with a short-lived connection each, so the
+    event loop never blocks on disk and no connection crosses threads.
+    Eviction follows :class:`InMemoryJobStore`.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float = 86400, max_jobs: int = 1000):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS jobs ("
+                    " id TEXT PRIMARY KEY, status TEXT NOT NULL,"
+                    " report_json TEXT, error TEXT, updated REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS jobs_updated ON jobs(updated)")
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    async def create(self, job_id: str) -> None:
+        await asyncio.to_thread(self._create, job_id, True)
+
+    async def create_if_absent(self, job_id: str) -> bool:
+        """See :meth:`InMemoryJobStore.create_if_absent`; atomic across processes."""
+        return await asyncio.to_thread(self._create, job_id, False)
+
+    async def update(self, job_id: str, **fields) -> None:
+        await asyncio.to_thread(self._update, job_id, fields)
+
+    async def get(self, job_id: str) -> dict | None:
+        return await asyncio.to_thread(self._get, job_id)
+
+    def _create(self, job_id: str, replace: bool) -> bool:
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "DELETE FROM jobs WHERE updated < ? AND status IN (?, ?)",
+                    (now - self.ttl_seconds, *_FINISHED),
+                )
+                (count,) = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+                excess = count + 1 - self.max_jobs
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM jobs WHERE id IN (SELECT id FROM jobs"
+                        " WHERE status IN (?, ?) ORDER BY updated LIMIT ?)",
+                        (*_FINISHED, excess),
+                    )
+                if replace:
+                    cur = conn.execute(
+                        "INSERT OR REPLACE INTO jobs (id, status, report_json, error, updated)"
+                        " VALUES (?, 'queued', NULL, NULL, ?)",
+                        (job_id, now),
+                    )
+                else:
+                    # One statement, so two workers can't both claim the id
+                    cur = conn.execute(
+                        "INSERT INTO jobs (id, status, report_json, error, updated)"
+                        " VALUES (?, 'queued', NULL, NULL, ?)"
+                        " ON CONFLICT(id) DO UPDATE SET status = 'queued',"
+                        " report_json = NULL, error = NULL, updated = excluded.updated"
+                        " WHERE jobs.status = 'failed'",
+                        (job_id, now),
+                    )
+                return cur.rowcount > 0
+        finally:
+            conn.close()
+
+    def _update(self, job_id: str, fields: dict) -> None:
+        columns, values = [], []
+        if "status" in fields:
+            columns.append("status = ?")
+            values.append(fields["status"])
+        if "report" in fields:
+            columns.append("report_json = ?")
+            report = fields["report"]
+            values.append(json.dumps(report) if report is not None else None)
+        if "error" in fields:
+            columns.append("error = ?")
+            values.append(fields["error"])
+        columns.append("updated = ?")
+        values.append(time.time())
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    f"UPDATE jobs SET {', '.join(columns)} WHERE id = ?",
+                    (*values, job_id),
+                )
+        finally:
+            conn.close()
+
+    def _get(self, job_id: str) -> dict | None:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT status, report_json, error FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        status, report_json, error = row
+        return {
+            "status": status,
+            "report": json.loads(report_json) if report_json else None,
+            "error": error,
+        }
+
+
+def make_job_store(backend: str, path: str | Path, ttl_seconds: float, max_jobs: int = 1000):
+    """Build the job store named by ``config.api.job_store``."""
+    if backend == "sqlite":
+        return SQLiteJobStore(path, ttl_seconds=ttl_seconds, max_jobs=max_jobs)
+    if backend == "memory":
+        return InMemoryJobStore(ttl_seconds=ttl_seconds, max_jobs=max_jobs)
+    raise ValueError(f"Unknown job store backend: {backend!r} (expected 'memory' or 'sqlite')")
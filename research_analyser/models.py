@@ -44,6 +44,9 @@ class AnalysisOptions:
         default_factory=lambda: ["soundness", "presentation", "contribution"]
     )
     output_format: Literal["markdown", "json", "html"] = "markdown"
+    # False: return the report while report files are still being written
+    # (long-running servers only; see ResearchAnalyser.wait_for_pending_saves)
+    wait_for_disk: bool = True
 
 
 @dataclass
@@ -166,6 +169,22 @@ class PeerReview:
     related_works: list[RelatedWork]
     raw_review: str
 
+    @classmethod
+    def from_dict(cls, data: dict) -> PeerReview:
+        """Rebuild a review from its ``dataclasses.asdict`` form."""
+        return cls(
+            overall_score=data["overall_score"],
+            confidence=data["confidence"],
+            dimensions={
+                key: DimensionScore(**dim) for key, dim in data["dimensions"].items()
+            },
+            strengths=list(data["strengths"]),
+            weaknesses=list(data["weaknesses"]),
+            suggestions=list(data["suggestions"]),
+            related_works=[RelatedWork(**rw) for rw in data["related_works"]],
+            raw_review=data["raw_review"],
+        )
+
     @staticmethod
     def compute_score(
         soundness: float, presentation: float, contribution: float
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import platform
 import re
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import Optional
 
 from research_analyser.exceptions import ExtractionError
 from research_analyser.models import (
@@ -26,6 +29,9 @@ logger = logging.getLogger(__name__)
 # Apple Silicon MonkeyOCR location
 _APPLE_SILICON_DIR = Path.home() / ".cache" / "research-analyser" / "MonkeyOCR-Apple-Silicon"
 
+# Bump when the cached raw-OCR payload layout changes
+_OCR_CACHE_VERSION = 1
+
 # Equation detection patterns
 DISPLAY_EQUATION_PATTERNS = [
     re.compile(r"\$\$(.+?)\$\$", re.DOTALL),
@@ -85,10 +91,19 @@ def is_apple_silicon_ocr_available() -> bool:
 class OCREngine:
     """Extract structured content from PDF using MonkeyOCR 1.5."""
 
-    def __init__(self, model_name: str = "MonkeyOCR-pro-3B", device: str = "auto"):
+    def __init__(
+        self,
+        model_name: str = "MonkeyOCR-pro-3B",
+        device: str = "auto",
+        cache_dir: str | Path | None = None,
+    ):
         self.model_name = model_name
         self.device = device
+        # Raw MonkeyOCR output is memoized here by PDF content hash; None disables
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self._model = None
+        self._model_lock = threading.Lock()
+        self._ocr_lock = threading.Lock()
         self._detected_device = detect_device() if device == "auto" else device
         self._use_apple_silicon = (
             self._detected_device == "apple_silicon"
@@ -107,17 +122,34 @@ class OCREngine:
         if self._model is not None:
             return
 
-        try:
-            from monkeyocr import MonkeyOCR
+        # warmup() loads from a worker thread; don't build the model twice.
+        with self._model_lock:
+            if self._model is not None:
+                return
+            try:
+                from monkeyocr import MonkeyOCR
 
-            self._model = MonkeyOCR(model_name=self.model_name, device=self.device)
-            logger.info(f"Loaded MonkeyOCR model: {self.model_name}")
-        except ImportError:
-            raise ExtractionError(
-                "MonkeyOCR is not installed. Install with: pip install monkeyocr"
-            )
-        except Exception as e:
-            raise ExtractionError(f"Failed to load MonkeyOCR model: {e}")
+                self._model = MonkeyOCR(model_name=self.model_name, device=self.device)
+                logger.info(f"Loaded MonkeyOCR model: {self.model_name}")
+            except ImportError:
+                raise ExtractionError(
+                    "MonkeyOCR is not installed. Install with: pip install monkeyocr"
+                )
+            except Exception as e:  # noqa: BLE001  (re-raised as ExtractionError)
+                raise ExtractionError(f"Failed to load MonkeyOCR model: {e}")
+
+    async def warmup(self) -> None:
+        """Load the model in a worker thread without running OCR.
+
+        Meant to overlap with PDF download. Load failures are only logged
+        here; extract() retries the load and raises them properly.
+        """
+        if self._use_apple_silicon or self._model is not None:
+            return
+        try:
+            await asyncio.to_thread(self._load_model)
+        except ExtractionError as e:
+            logger.debug(f"OCR warmup failed: {e}")
 
     def _run_apple_silicon_ocr(self, pdf_path: Path, output_dir: Path) -> None:
         """Run OCR via the Apple Silicon MonkeyOCR subprocess.
@@ -182,14 +214,50 @@ print("OCR_BRIDGE_SUCCESS")
         except Exception as e:
             raise ExtractionError(f"Apple Silicon OCR subprocess error: {e}")
 
-    async def extract(self, pdf_path: Path) -> ExtractedContent:
-        """Full extraction pipeline.
-
-        1. Load PDF, run MonkeyOCR parse (standard or Apple Silicon)
-        2. Merge page results into unified document
-        3. Post-process: equation detection, table parsing, figure extraction
-        4. Build structured ExtractedContent
-        """
+    def _cache_path(self, pdf_path: Path) -> Path:
+        """Cache file for *pdf_path*, keyed on its bytes and the OCR backend."""
+        h = hashlib.blake2b(digest_size=20)
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        backend = "apple_silicon" if self._use_apple_silicon else "standard"
+        h.update(f"\0{self.model_name}\0{backend}".encode())
+        return self.cache_dir / f"{h.hexdigest()}.json"
+
+    def _load_cached(self, cache_path: Path) -> tuple[str, list] | None:
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable OCR cache {cache_path}: {e}")
+            return None
+        if payload.get("version") != _OCR_CACHE_VERSION:
+            return None
+        return payload.get("markdown", ""), payload.get("blocks", [])
+
+    def _store_cached(self, cache_path: Path, markdown_text: str, blocks: list) -> None:
+        payload = {
+            "version": _OCR_CACHE_VERSION,
+            "model": self.model_name,
+            "markdown": markdown_text,
+            "blocks": blocks,
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f)
+                os.replace(tmp, cache_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write OCR cache {cache_path}: {e}")
+
+    def _run_ocr(self, pdf_path: Path) -> tuple[str, list]:
+        """Run MonkeyOCR on *pdf_path*; return (markdown, layout blocks)."""
         self._load_model()
 
         try:
@@ -218,6 +286,39 @@ print("OCR_BRIDGE_SUCCESS")
         except Exception as e:
             raise ExtractionError(f"MonkeyOCR extraction failed: {e}")
 
+        return markdown_text, blocks
+
+    async def extract(self, pdf_path: Path) -> ExtractedContent:
+        """Full extraction pipeline.
+
+        1. Load PDF, run MonkeyOCR parse (standard or Apple Silicon)
+        2. Merge page results into unified document
+        3. Post-process: equation detection, table parsing, figure extraction
+        4. Build structured ExtractedContent
+
+        With ``cache_dir`` set, step 1 is skipped for a PDF whose bytes were
+        OCR'd before; post-processing always reruns so arXiv sidecars
+        (.meta.json / .source.tex) and parser fixes still apply.
+
+        The whole pipeline is synchronous (torch / subprocess / regex), so it
+        runs in a worker thread and the event loop stays free for other jobs.
+        """
+        return await asyncio.to_thread(self._extract_sync, pdf_path)
+
+    def _extract_sync(self, pdf_path: Path) -> ExtractedContent:
+        cache_path = self._cache_path(pdf_path) if self.cache_dir else None
+        cached = self._load_cached(cache_path) if cache_path else None
+        if cached is not None:
+            logger.info(f"Using cached OCR output for {pdf_path.name}")
+            markdown_text, blocks = cached
+        else:
+            # One parse at a time: MonkeyOCR makes no thread-safety promise and
+            # a second concurrent pass would only contend for the same GPU.
+            with self._ocr_lock:
+                markdown_text, blocks = self._run_ocr(pdf_path)
+            if cache_path:
+                self._store_cached(cache_path, markdown_text, blocks)
+
         # Post-process extracted content
         sections = self.parse_sections(markdown_text)
         equations = self.extract_equations(markdown_text)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from html import escape
@@ -110,8 +111,9 @@ class ReportGenerator:
             lines.append("### Dimensional Scores\n")
             lines.append("| Dimension | Score | Weight |")
             lines.append("|-----------|-------|--------|")
+            total_weight = sum(d.weight for d in review.dimensions.values())
             for name, dim in review.dimensions.items():
-                pct = dim.weight / sum(d.weight for d in review.dimensions.values()) * 100
+                pct = dim.weight / total_weight * 100
                 lines.append(f"| {dim.name} | {dim.score:.1f}/4 | {pct:.1f}% |")
             lines.append("")
 
@@ -401,6 +403,10 @@ class ReportGenerator:
         parts.append("</html>")
         return "\n".join(parts)
 
+    async def asave_all(self, report: AnalysisReport, output_dir: Path) -> None:
+        """Run :meth:`save_all` in a worker thread."""
+        await asyncio.to_thread(self.save_all, report, output_dir)
+
     def save_all(self, report: AnalysisReport, output_dir: Path) -> None:
         """Save all outputs to directory structure."""
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -16,7 +16,7 @@ if [[ -n "${SKIP_SSL_VERIFICATION:-}" ]]; then
 fi
 
 python -m pip install --upgrade pip
-python -m pip install pyinstaller
+python -m pip install pyinstaller zstandard Pillow numpy
 
 APP_NAME="ResearchAnalyser"
 
@@ -70,9 +70,15 @@ else
   echo "  Using cached Python 3.12 tarball: $PY_CACHE ($(du -sh "$PY_CACHE" | cut -f1))"
 fi
 
-# Symlink/copy into a predictable name that PyInstaller --add-data will pick up
-cp "$PY_CACHE" "packaging/python312.tar.gz"
-echo "  Bundled Python 3.12 ready."
+# Recompress as zstd under a predictable name that PyInstaller --add-data will
+# pick up — the launcher decodes .tar.zst several times faster than .tar.gz.
+python - "$PY_CACHE" "packaging/python312.tar.zst" <<'PYEOF'
+import gzip, sys, zstandard
+src, dst = sys.argv[1], sys.argv[2]
+with gzip.open(src, "rb") as fin, open(dst, "wb") as fout:
+    zstandard.ZstdCompressor(level=19, threads=-1).copy_stream(fin, fout)
+PYEOF
+echo "  Bundled Python 3.12 ready ($(du -sh packaging/python312.tar.zst | cut -f1) zstd)."
 # (Cleaned up after PyInstaller below)
 DIST_DIR="dist"
 BUILD_DIR="build"
@@ -107,15 +113,16 @@ pyinstaller \
   --add-data "monkeyocr.py:." \
   --add-data "research_analyser:research_analyser" \
   --add-data ".streamlit:.streamlit" \
-  --add-data "packaging/python312.tar.gz:." \
+  --add-data "packaging/python312.tar.zst:." \
   --add-data "packaging/beautiful_mermaid/render.bundle.mjs:packaging/beautiful_mermaid" \
   --collect-all webview \
   --hidden-import webview \
   --hidden-import webview.platforms.cocoa \
+  --hidden-import zstandard \
   packaging/macos_launcher.py
 
 # Clean up the staging copy (the cache stays in packaging/python_cache/)
-rm -f "packaging/python312.tar.gz"
+rm -f "packaging/python312.tar.zst"
 
 APP_PATH="$DIST_DIR/${APP_NAME}.app"
 
@@ -1,9 +1,11 @@
 """Tests for input handler."""
 
+import asyncio
+
 import pytest
 
 from research_analyser.input_handler import InputHandler
-from research_analyser.models import SourceType
+from research_analyser.models import PaperInput, SourceType
 
 
 @pytest.fixture
@@ -45,3 +47,65 @@ def test_extract_arxiv_id(handler):
     assert handler._extract_arxiv_id("https://arxiv.org/abs/2401.12345") == "2401.12345"
     assert handler._extract_arxiv_id("https://arxiv.org/pdf/2401.12345v2") == "2401.12345v2"
     assert handler._extract_arxiv_id("2401.12345") == "2401.12345"
+
+
+def _counting_remote(handler, tmp_path):
+    calls = []
+
+    async def fake_remote(paper_input):
+        calls.append(paper_input.source_value)
+        await asyncio.sleep(0.01)
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        return path
+
+    handler._resolve_remote = fake_remote
+    return calls
+
+
+def test_concurrent_resolves_share_one_download(handler, tmp_path):
+    calls = _counting_remote(handler, tmp_path)
+    paper = PaperInput(source_type=SourceType.ARXIV_ID, source_value="2401.12345")
+
+    async def run():
+        return await asyncio.gather(handler.resolve(paper), handler.resolve(paper))
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert calls == ["2401.12345"]
+
+
+def test_recent_download_is_reused_across_handlers(tmp_path):
+    paper = PaperInput(source_type=SourceType.ARXIV_ID, source_value="2401.12345")
+    first = InputHandler(temp_dir=str(tmp_path), download_ttl=60)
+    first_calls = _counting_remote(first, tmp_path)
+    asyncio.run(first.resolve(paper))
+
+    second = InputHandler(temp_dir=str(tmp_path), download_ttl=60)
+    second_calls = _counting_remote(second, tmp_path)
+    assert asyncio.run(second.resolve(paper)) == tmp_path / "paper.pdf"
+    assert first_calls == ["2401.12345"]
+    assert second_calls == []
+
+
+def test_same_named_urls_download_to_separate_files(tmp_path):
+    handler = InputHandler(temp_dir=str(tmp_path), download_ttl=60)
+
+    async def fake_remote(paper_input):
+        path = handler._output_dir() / "paper.pdf"
+        path.write_text(paper_input.source_value)
+        return path
+
+    handler._resolve_remote = fake_remote
+    urls = ("https://a.example/x/paper.pdf", "https://b.example/y/paper.pdf")
+
+    async def run():
+        return [
+            await handler.resolve(PaperInput(source_type=SourceType.PDF_URL, source_value=url))
+            for url in (*urls, urls[0])
+        ]
+
+    first, second, again = asyncio.run(run())
+    assert first != second and again == first
+    assert first.read_text() == urls[0]
+    assert second.read_text() == urls[1]
@@ -0,0 +1,98 @@
+"""Tests for the API job stores."""
+
+import asyncio
+
+import pytest
+
+from research_analyser.job_store import InMemoryJobStore, SQLiteJobStore, make_job_store
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    return make_job_store(request.param, tmp_path / "jobs.sqlite3", ttl_seconds=3600)
+
+
+def test_job_lifecycle(store):
+    async def run():
+        await store.create("job-1")
+        assert await store.get("job-1") == {"status": "queued", "report": None, "error": None}
+
+        await store.update("job-1", status="processing")
+        await store.update("job-1", status="completed", report={"title": "T", "n": [1, 2]})
+        return await store.get("job-1")
+
+    job = asyncio.run(run())
+    assert job["status"] == "completed"
+    assert job["report"] == {"title": "T", "n": [1, 2]}
+    assert job["error"] is None
+
+
+def test_unknown_job_is_none(store):
+    assert asyncio.run(store.get("missing")) is None
+
+
+@pytest.mark.parametrize("cls", [InMemoryJobStore, SQLiteJobStore])
+def test_finished_jobs_expire(cls, tmp_path):
+    kwargs = {"path": tmp_path / "jobs.sqlite3"} if cls is SQLiteJobStore else {}
+    store = cls(ttl_seconds=0, **kwargs)
+
+    async def run():
+        await store.create("done")
+        await store.update("done", status="failed", error="boom")
+        await store.create("running")
+        await store.update("running", status="processing")
+        await asyncio.sleep(0.01)
+        await store.create("new")  # creating a job evicts expired finished ones
+        return [await store.get(j) for j in ("done", "running", "new")]
+
+    done, running, new = asyncio.run(run())
+    assert done is None
+    assert running["status"] == "processing"
+    assert new["status"] == "queued"
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    writer, reader = SQLiteJobStore(path), SQLiteJobStore(path)
+    asyncio.run(writer.create("job-1"))
+    assert asyncio.run(reader.get("job-1"))["status"] == "queued"
+
+
+def test_unknown_backend_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        make_job_store("redis", tmp_path / "x", 60)
+
+
+@pytest.mark.parametrize("cls", [InMemoryJobStore, SQLiteJobStore])
+def test_oldest_finished_jobs_evicted_over_cap(cls, tmp_path):
+    kwargs = {"path": tmp_path / "jobs.sqlite3"} if cls is SQLiteJobStore else {}
+    store = cls(ttl_seconds=3600, max_jobs=3, **kwargs)
+
+    async def run():
+        await store.create("running")
+        await store.update("running", status="processing")
+        for job_id in ("old", "newer"):
+            await store.create(job_id)
+            await store.update(job_id, status="completed", report={})
+            await asyncio.sleep(0.01)
+        await store.create("new")  # over the cap: "old" goes, "running" stays
+        return [await store.get(j) for j in ("running", "old", "newer", "new")]
+
+    running, old, newer, new = asyncio.run(run())
+    assert running["status"] == "processing"
+    assert old is None
+    assert newer["status"] == "completed"
+    assert new["status"] == "queued"
+
+
+def test_create_if_absent_only_claims_free_or_failed_jobs(store):
+    async def run():
+        first = await store.create_if_absent("job-1")
+        again = await store.create_if_absent("job-1")
+        await store.update("job-1", status="failed", error="boom")
+        retry = await store.create_if_absent("job-1")
+        return first, again, retry, await store.get("job-1")
+
+    first, again, retry, job = asyncio.run(run())
+    assert (first, again, retry) == (True, False, True)
+    assert job == {"status": "queued", "report": None, "error": None}
@@ -30,3 +30,27 @@ def test_compute_score_weights():
     delta_c = PeerReview.compute_score(2, 2, 3) - base
 
     assert delta_c > delta_s > delta_p
+
+
+def test_peer_review_from_dict_round_trip():
+    """from_dict() rebuilds the nested dataclasses written by asdict()."""
+    import json
+    from dataclasses import asdict
+
+    from research_analyser.models import DimensionScore, RelatedWork
+
+    review = PeerReview(
+        overall_score=6.2,
+        confidence=3.5,
+        dimensions={"soundness": DimensionScore("soundness", 3.0, 0.7134, "ok")},
+        strengths=["clear"],
+        weaknesses=["small eval"],
+        suggestions=["more baselines"],
+        related_works=[RelatedWork(title="Prior", authors=["A. Author"], url=None)],
+        raw_review="...",
+    )
+    restored = PeerReview.from_dict(json.loads(json.dumps(asdict(review))))
+
+    assert restored == review
+    assert isinstance(restored.dimensions["soundness"], DimensionScore)
+    assert isinstance(restored.related_works[0], RelatedWork)
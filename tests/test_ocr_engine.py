@@ -91,3 +91,28 @@ $$
     labeled = [eq for eq in equations if eq.label]
     assert len(labeled) >= 1
     assert labeled[0].label == "eq:loss"
+
+
+def test_extract_reuses_cached_ocr_output(tmp_path):
+    import asyncio
+
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 fake content")
+    engine = OCREngine(cache_dir=tmp_path / "cache")
+    calls = []
+
+    def fake_run_ocr(path):
+        calls.append(path)
+        return "# Paper\n\n## Method\n\n$$x = y$$\n", []
+
+    engine._run_ocr = fake_run_ocr
+    first = asyncio.run(engine.extract(pdf))
+    second = asyncio.run(engine.extract(pdf))
+
+    assert len(calls) == 1
+    assert second.full_text == first.full_text
+    assert len(second.equations) == 1
+
+    pdf.write_bytes(b"%PDF-1.4 other content")
+    asyncio.run(engine.extract(pdf))
+    assert len(calls) == 2
@@ -76,3 +76,11 @@ class TestSaveAllStormReport:
         ReportGenerator().save_all(report, tmp_path)
         written = (tmp_path / "storm_report.md").read_text(encoding="utf-8")
         assert written == content
+
+
+def test_asave_all_writes_standard_outputs(tmp_path):
+    import asyncio
+
+    asyncio.run(ReportGenerator().asave_all(_make_report(), tmp_path))
+    for name in ("report.md", "key_points.md", "report.html", "metadata.json"):
+        assert (tmp_path / name).exists(), f"{name} missing"